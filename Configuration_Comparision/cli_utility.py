@@ -1,28 +1,118 @@
-def output_excel(comparison_results, security_issues, output_file=None, only_mismatches=False):
-    """Output results to Excel with security analysis"""
-    if not output_file:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"properties_comparison_{timestamp}.xlsx"
-    
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        # Security Summary sheet
-        create_security_summary_sheet(writer, security_issues)
-        
-        # Main Summary sheet
-        summary_data = []
-        for env_config, env_data in comparison_results.#!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 CLI utility for microservice properties comparison
 Usage: python cli_compare.py --repo-url https://github.com/org/repo --microservices service1,service2,service3
 """
 
 import argparse
-import json
+import csv
+import importlib.util
 import sys
 from app import GitHubAPIPropertyComparator
-import pandas as pd
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
+import functools
+import io
+import itertools
 import os
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+# Output libraries are imported by the functions that use them so that
+# console runs do not pay their import cost
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+try:
+    import orjson  # C serializer, much faster than json for large reports
+except ImportError:
+    orjson = None
+
+# Row highlight colors for each security risk level, highest severity first
+SECURITY_RISK_COLORS = (('🔴', 'FFEBEE'), ('🟡', 'FFF3E0'), ('🔵', 'E3F2FD'))
+
+# Values containing any of these words are masked in the Excel report
+SENSITIVE_VALUE_RE = re.compile(r'password|secret|key', re.IGNORECASE)
+
+SUMMARY_HEADERS = ('Environment', 'Microservices', 'Total Properties', 'Matched', 'Mismatched',
+                   'Security Issues', 'Match %', 'Security Status')
+
+# Header of the statistics block below the security issues
+SECURITY_STATS_HEADER = ('Category', 'Count')
+
+SECURITY_COLUMNS = ('Environment', 'Microservice', 'Property', 'Issue_Category', 'Issue_Type',
+                    'Severity', 'Value', 'Recommendation')
+
+SEVERITY_EMOJI = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🔵'}
+SEVERITY_RANK = {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
+
+SECURITY_RECOMMENDATIONS = {
+    'password': 'Use environment variables or secret management service',
+    'secret': 'Externalize to HashiCorp Vault, AWS Secrets Manager, or similar',
+    'key': 'Store in secure key management system',
+    'token': 'Use OAuth2 or JWT with external token provider',
+    'credential': 'Use service accounts or external identity providers',
+    'http_urls': 'Replace HTTP with HTTPS for secure communication',
+    'unencrypted_db': 'Enable SSL/TLS for database connections',
+    'insecure_protocols': 'Use secure protocol versions (HTTPS, TLS 1.2+)',
+    'ssl_disabled': 'Enable SSL/TLS encryption in production',
+    'debug_enabled': 'Disable debug mode in production environments',
+    'weak_encryption': 'Use strong encryption algorithms (AES-256, SHA-256+)',
+    'permissive_cors': 'Restrict CORS to specific allowed origins',
+    'no_authentication': 'Enable authentication mechanisms'
+}
+
+@dataclass
+class SecurityIndex:
+    """Everything the reports need from security_issues, gathered in a single pass
+    
+    rows holds one (environment, microservice, property, category, issue_type,
+    severity, value) tuple per issue; risks maps (environment, property) to the
+    label of that property's most severe issue.
+    """
+    by_category: Counter = field(default_factory=Counter)
+    by_env: Counter = field(default_factory=Counter)
+    by_severity: Counter = field(default_factory=Counter)
+    rows: list = field(default_factory=list)
+    risks: dict = field(default_factory=dict)
+    
+    @property
+    def critical(self):
+        return self.by_category['hardcoded_secrets']
+    
+    @property
+    def medium(self):
+        return self.by_category['insecure_protocols']
+    
+    @property
+    def low(self):
+        return self.by_category['weak_configurations']
+    
+    @property
+    def total(self):
+        return len(self.rows)
+    
+    @classmethod
+    def from_issues(cls, security_issues):
+        index = cls()
+        best_rank = {}
+        for issue_category, category_data in security_issues.items():
+            category_name = issue_category.replace('_', ' ').title()
+            for env_config, issues in category_data.items():
+                index.by_category[issue_category] += len(issues)
+                index.by_env[env_config] += len(issues)
+                for issue in issues:
+                    severity = issue['severity']
+                    index.by_severity[severity] += 1
+                    index.rows.append((env_config, issue['microservice'], issue['property'], category_name,
+                                       issue['issue_type'], severity, issue['value']))
+                    
+                    key = (env_config, issue['property'])
+                    rank = SEVERITY_RANK.get(severity, 0)
+                    if key not in index.risks or rank > best_rank[key]:
+                        best_rank[key] = rank
+                        index.risks[key] = f"{SEVERITY_EMOJI.get(severity, '⚪')} {issue['issue_type']}"
+        return index
 
 def main():
     parser = argparse.ArgumentParser(description='Compare microservice properties')
@@ -36,6 +126,8 @@ def main():
     parser.add_argument('--output-file', help='Output file path (for json, excel, csv)')
     parser.add_argument('--only-mismatches', action='store_true', 
                        help='Show only mismatched properties')
+    parser.add_argument('--fast-excel', action='store_true',
+                       help='Stream Excel XML directly (much faster for very large reports)')
     parser.add_argument('--environment', help='Filter by specific environment (e.g., dev_dev1)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     
@@ -78,6 +170,7 @@ def main():
             print("Analyzing security issues...")
         
         security_issues = comparator.analyze_security_issues(all_data)
+        security_index = SecurityIndex.from_issues(security_issues)
         
         # Filter by environment if specified
         if args.environment:
@@ -91,16 +184,18 @@ def main():
         
         # Generate output
         if args.output == 'console':
-            output_console(comparison_results, security_issues, args.only_mismatches, args.verbose)
+            output_console(comparison_results, security_issues, args.only_mismatches, args.verbose,
+                           security_index=security_index)
         elif args.output == 'json':
             output_json(comparison_results, security_issues, args.output_file, args.only_mismatches)
         elif args.output == 'excel':
-            output_excel(comparison_results, security_issues, args.output_file, args.only_mismatches)
+            output_excel(comparison_results, security_issues, args.output_file, args.only_mismatches,
+                         fast=args.fast_excel, security_index=security_index)
         elif args.output == 'csv':
             output_csv(comparison_results, security_issues, args.output_file, args.only_mismatches)
         
         if args.verbose:
-            print_summary(comparison_results, security_issues)
+            print_summary(comparison_results, security_issues, security_index)
             
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
@@ -109,69 +204,76 @@ def main():
             traceback.print_exc()
         sys.exit(1)
 
-def output_console(comparison_results, security_issues, only_mismatches=False, verbose=False):
+def output_console(comparison_results, security_issues, only_mismatches=False, verbose=False,
+                   security_index=None):
     """Output results to console"""
     # First, show security issues if any
-    show_security_summary(security_issues)
+    show_security_summary(security_issues, security_index)
     
     for env_config, env_data in comparison_results.items():
-        print(f"\n{'='*60}")
-        print(f"ENVIRONMENT: {env_config.upper()}")
-        print(f"{'='*60}")
-        print(f"Microservices: {', '.join(env_data['microservices'])}")
-        print(f"Total Properties: {env_data['total_properties']}")
-        print(f"Matched: {env_data['matched_count']}")
-        print(f"Mismatched: {env_data['mismatched_count']}")
+        # Each environment is rendered into a buffer and written with a single call
+        buf = io.StringIO()
+        print(f"\n{'='*60}", file=buf)
+        print(f"ENVIRONMENT: {env_config.upper()}", file=buf)
+        print(f"{'='*60}", file=buf)
+        print(f"Microservices: {', '.join(env_data['microservices'])}", file=buf)
+        print(f"Total Properties: {env_data['total_properties']}", file=buf)
+        print(f"Matched: {env_data['matched_count']}", file=buf)
+        print(f"Mismatched: {env_data['mismatched_count']}", file=buf)
         
         # Show mismatched properties
         if env_data['mismatched_count'] > 0:
-            print(f"\n❌ MISMATCHED PROPERTIES ({env_data['mismatched_count']}):")
-            print("-" * 40)
+            print(f"\n❌ MISMATCHED PROPERTIES ({env_data['mismatched_count']}):", file=buf)
+            print("-" * 40, file=buf)
             for prop_key, ms_values in env_data['mismatched'].items():
-                print(f"\n🔑 {prop_key}")
-                for ms, value in ms_values.items():
-                    print(f"   {ms:20} = {value}")
+                print(f"\n🔑 {prop_key}", file=buf)
+                print('\n'.join([f"   {ms.ljust(20)} = {value}" for ms, value in ms_values.items()]), file=buf)
         
         # Show matched properties if not filtering
         if not only_mismatches and env_data['matched_count'] > 0:
-            print(f"\n✅ MATCHED PROPERTIES ({env_data['matched_count']}):")
-            print("-" * 40)
+            print(f"\n✅ MATCHED PROPERTIES ({env_data['matched_count']}):", file=buf)
+            print("-" * 40, file=buf)
             for prop_key, ms_values in env_data['matching'].items():
-                value = list(ms_values.values())[0]  # All values are the same
-                print(f"🔑 {prop_key} = {value}")
+                value = next(iter(ms_values.values()))  # All values are the same
+                print(f"🔑 {prop_key} = {value}", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
 
-def show_security_summary(security_issues):
+def show_security_summary(security_issues, security_index=None):
     """Show security issues summary"""
-    total_secrets = sum(len(issues) for issues in security_issues['hardcoded_secrets'].values())
-    total_insecure = sum(len(issues) for issues in security_issues['insecure_protocols'].values())
-    total_weak = sum(len(issues) for issues in security_issues['weak_configurations'].values())
+    security_index = security_index or SecurityIndex.from_issues(security_issues)
+    total_secrets, total_insecure, total_weak = security_index.critical, security_index.medium, security_index.low
     
-    if total_secrets + total_insecure + total_weak == 0:
+    if security_index.total == 0:
         print("🔒 SECURITY: No security issues detected")
         return
     
-    print(f"\n{'🚨 SECURITY ANALYSIS'}")
-    print("=" * 60)
+    buf = io.StringIO()
+    print(f"\n{'🚨 SECURITY ANALYSIS'}", file=buf)
+    print("=" * 60, file=buf)
     
     if total_secrets > 0:
-        print(f"🔴 CRITICAL: {total_secrets} hardcoded secrets found")
+        print(f"🔴 CRITICAL: {total_secrets} hardcoded secrets found", file=buf)
         for env, issues in security_issues['hardcoded_secrets'].items():
             for issue in issues:
                 masked_value = mask_value(issue['value'])
-                print(f"   {env} | {issue['microservice']} | {issue['property']} = {masked_value}")
+                print(f"   {env} | {issue['microservice']} | {issue['property']} = {masked_value}", file=buf)
     
     if total_insecure > 0:
-        print(f"🟡 MEDIUM: {total_insecure} insecure protocol configurations")
+        print(f"🟡 MEDIUM: {total_insecure} insecure protocol configurations", file=buf)
         for env, issues in security_issues['insecure_protocols'].items():
             for issue in issues:
-                print(f"   {env} | {issue['microservice']} | {issue['property']} = {issue['value']}")
+                print(f"   {env} | {issue['microservice']} | {issue['property']} = {issue['value']}", file=buf)
     
     if total_weak > 0:
-        print(f"🔵 LOW-MEDIUM: {total_weak} weak security configurations")
+        print(f"🔵 LOW-MEDIUM: {total_weak} weak security configurations", file=buf)
         for env, issues in security_issues['weak_configurations'].items():
             for issue in issues:
-                print(f"   {env} | {issue['microservice']} | {issue['property']} = {issue['value']}")
+                print(f"   {env} | {issue['microservice']} | {issue['property']} = {issue['value']}", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
 
+@functools.lru_cache(maxsize=4096)
 def mask_value(value):
     """Mask sensitive values for console output"""
     if len(value) > 8:
@@ -181,224 +283,465 @@ def mask_value(value):
     else:
         return '*' * len(value)
 
-def output_json(comparison_results, output_file=None, only_mismatches=False):
+def output_json(comparison_results, security_issues, output_file=None, only_mismatches=False):
     """Output results to JSON"""
     if only_mismatches:
-        filtered_results = {}
-        for env, data in comparison_results.items():
-            if data['mismatched_count'] > 0:
-                filtered_results[env] = {
-                    'microservices': data['microservices'],
-                    'mismatched': data['mismatched'],
-                    'mismatched_count': data['mismatched_count']
-                }
-        output_data = filtered_results
-    else:
-        output_data = comparison_results
+        # Environments without mismatches are dropped entirely
+        comparison_results = {
+            env: {
+                'microservices': data['microservices'],
+                'mismatched': data['mismatched'],
+                'mismatched_count': data['mismatched_count']
+            }
+            for env, data in comparison_results.items()
+            if data['mismatched_count']
+        }
+    
+    # Secrets are masked the same way as on the console, since JSON output often ends up in CI logs
+    security_analysis = dict(security_issues)
+    security_analysis['hardcoded_secrets'] = {
+        env: [{**issue, 'value': mask_value(issue['value'])} for issue in issues]
+        for env, issues in security_issues.get('hardcoded_secrets', {}).items()
+    }
     
-    json_output = json.dumps(output_data, indent=2)
+    output_data = {
+        'comparison_results': comparison_results,
+        'security_analysis': security_analysis
+    }
+    
+    json_output = dump_json(output_data)
     
     if output_file:
-        with open(output_file, 'w') as f:
+        with open(output_file, 'wb') as f:
             f.write(json_output)
         print(f"JSON output saved to: {output_file}")
     else:
-        print(json_output)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_output + b'\n')
+        sys.stdout.buffer.flush()
+
+def dump_json(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
-def output_excel(comparison_results, security_issues, output_file=None, only_mismatches=False):
+def output_excel(comparison_results, security_issues, output_file=None, only_mismatches=False, fast=False,
+                 security_index=None):
     """Output results to Excel with security analysis"""
     if not output_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"properties_comparison_{timestamp}.xlsx"
     
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+    # Built once so each property row costs a dict lookup instead of a scan of all issues
+    security_index = security_index or SecurityIndex.from_issues(security_issues)
+    risk_index = security_index.risks
+    
+    if fast:
+        write_xlsx_stream(iter_stream_sheets(comparison_results, security_index, only_mismatches), output_file)
+        print(f"Excel output with security analysis saved to: {output_file}")
+        return
+    
+    if EXCEL_ENGINE == 'openpyxl':
+        write_excel_write_only(comparison_results, security_index, output_file, only_mismatches)
+        print(f"Excel output with security analysis saved to: {output_file}")
+        return
+    
+    # constant_memory flushes each row to disk as soon as the next one starts, so
+    # sheets must be written row by row (pandas' to_excel writes column-major)
+    import xlsxwriter
+    
+    with xlsxwriter.Workbook(output_file, {'constant_memory': True}) as workbook:
+        header_fmt = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        risk_formats = [(marker, workbook.add_format({'bg_color': f'#{color}'}))
+                        for marker, color in SECURITY_RISK_COLORS]
+        
         # Security Summary sheet (first sheet for visibility)
-        create_security_summary_sheet(writer, security_issues)
+        create_security_summary_sheet(workbook, security_index, header_fmt)
         
         # Main Summary sheet
-        summary_data = []
-        for env_config, env_data in comparison_results.items():
-            # Count security issues for this environment
-            env_security_count = 0
-            for issue_type in security_issues.values():
-                if env_config in issue_type:
-                    env_security_count += len(issue_type[env_config])
-            
-            summary_data.append({
-                'Environment': env_config,
-                'Microservices': len(env_data['microservices']),
-                'Total Properties': env_data['total_properties'],
-                'Matched': env_data['matched_count'],
-                'Mismatched': env_data['mismatched_count'],
-                'Security Issues': env_security_count,
-                'Match %': f"{(env_data['matched_count'] / max(env_data['total_properties'], 1)) * 100:.1f}%",
-                'Security Status': '🔴 CRITICAL' if env_security_count > 0 else '🟢 SECURE'
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        worksheet = workbook.add_worksheet('Summary')
+        summary_data = build_summary_data(comparison_results, security_index)
+        if summary_data:
+            worksheet.write_row(0, 0, SUMMARY_HEADERS, header_fmt)
+            for row_idx, row in enumerate(summary_data, start=1):
+                worksheet.write_row(row_idx, 0, row)
         
         # Detailed sheets for each environment
-        for env_config, env_data in comparison_results.items():
-            sheet_data = []
-            microservices = env_data['microservices']
+        for sheet_name, columns in build_environment_sheets(comparison_results, risk_index, only_mismatches):
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, list(columns), header_fmt)
+            for row_idx, row in enumerate(zip(*columns.values()), start=1):
+                worksheet.write_row(row_idx, 0, row)
             
-            # Add mismatched properties
-            for prop_key, ms_values in env_data['mismatched'].items():
-                row = {'Property': prop_key, 'Status': 'MISMATCH', 'Security_Risk': ''}
-                
-                # Check if this property has security issues
-                security_risk = check_property_security_risk(prop_key, ms_values, security_issues, env_config)
-                if security_risk:
-                    row['Security_Risk'] = security_risk
-                
-                for ms in microservices:
-                    row[ms] = ms_values.get(ms, 'N/A')
-                sheet_data.append(row)
-            
-            # Add matched properties (if not filtering)
-            if not only_mismatches:
-                for prop_key, ms_values in env_data['matching'].items():
-                    row = {'Property': prop_key, 'Status': 'MATCH', 'Security_Risk': ''}
-                    
-                    # Check if this property has security issues
-                    security_risk = check_property_security_risk(prop_key, ms_values, security_issues, env_config)
-                    if security_risk:
-                        row['Security_Risk'] = security_risk
-                    
-                    for ms in microservices:
-                        row[ms] = ms_values.get(ms, 'N/A')
-                    sheet_data.append(row)
-            
-            if sheet_data:
-                df = pd.DataFrame(sheet_data)
-                sheet_name = env_config.replace('/', '_')[:31]  # Excel sheet name limit
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Apply conditional formatting
-                workbook = writer.book
-                worksheet = writer.sheets[sheet_name]
-                apply_security_formatting(workbook, worksheet, df)
+            # Apply conditional formatting
+            apply_security_formatting(worksheet, columns, risk_formats)
     
     print(f"Excel output with security analysis saved to: {output_file}")
 
-def create_security_summary_sheet(writer, security_issues):
-    """Create a dedicated security summary sheet"""
-    security_data = []
+def iter_stream_sheets(comparison_results, security_index, only_mismatches=False):
+    """Yield (sheet name, rows) for write_xlsx_stream, building each sheet only when it is written"""
+    yield '🔒 Security Issues', iter_security_sheet_rows(security_index)
     
-    # Collect all security issues
-    for issue_category, category_data in security_issues.items():
-        category_name = issue_category.replace('_', ' ').title()
-        for env, issues in category_data.items():
-            for issue in issues:
-                security_data.append({
-                    'Environment': env,
-                    'Microservice': issue['microservice'],
-                    'Property': issue['property'],
-                    'Issue_Category': category_name,
-                    'Issue_Type': issue['issue_type'],
-                    'Severity': issue['severity'],
-                    'Value': mask_value_for_excel(issue['value']),
-                    'Recommendation': get_security_recommendation(issue['issue_type'])
-                })
-    
-    if security_data:
-        security_df = pd.DataFrame(security_data)
-        security_df.to_excel(writer, sheet_name='🔒 Security Issues', index=False)
-        
-        # Add security statistics
-        stats_data = []
-        total_critical = sum(1 for item in security_data if item['Severity'] == 'HIGH')
-        total_medium = sum(1 for item in security_data if item['Severity'] == 'MEDIUM')
-        total_low = sum(1 for item in security_data if item['Severity'] == 'LOW')
-        
-        stats_data.append(['🔴 CRITICAL Issues', total_critical])
-        stats_data.append(['🟡 MEDIUM Issues', total_medium])
-        stats_data.append(['🔵 LOW Issues', total_low])
-        stats_data.append(['📊 Total Issues', len(security_data)])
+    summary_data = build_summary_data(comparison_results, security_index)
+    yield 'Summary', [SUMMARY_HEADERS, *summary_data] if summary_data else []
+    
+    for sheet_name, columns in build_environment_sheets(comparison_results, security_index.risks, only_mismatches):
+        yield sheet_name, itertools.chain([list(columns)], zip(*columns.values()))
+
+def write_excel_write_only(comparison_results, security_index, output_file, only_mismatches=False):
+    """Stream the workbook with openpyxl write-only mode (fallback when xlsxwriter is missing)
+    
+    Rows are appended as they are built, so openpyxl never holds the cell DOM in
+    memory; installing lxml makes the streaming serializer considerably faster.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    
+    wb = Workbook(write_only=True)
+    
+    # Same header format as the xlsxwriter and streaming writers
+    thin = Side(style='thin')
+    header_font = Font(bold=True)
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal='center')
+    
+    def header_cells(ws, row):
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            cells.append(cell)
+        return cells
+    
+    # Security Summary sheet (first sheet for visibility)
+    ws = wb.create_sheet('🔒 Security Issues')
+    for row_idx, row in enumerate(iter_security_sheet_rows(security_index)):
+        ws.append(header_cells(ws, row) if is_header_row(row_idx, row) else row)
+    
+    # Main Summary sheet
+    summary_data = build_summary_data(comparison_results, security_index)
+    ws = wb.create_sheet('Summary')
+    if summary_data:
+        ws.append(header_cells(ws, SUMMARY_HEADERS))
+        for row in summary_data:
+            ws.append(row)
+    
+    # Detailed sheets for each environment
+    fills = {
+        marker: PatternFill(start_color=color, end_color=color, fill_type='solid')
+        for marker, color in SECURITY_RISK_COLORS
+    }
+    for sheet_name, columns in build_environment_sheets(comparison_results, security_index.risks, only_mismatches):
+        ws = wb.create_sheet(sheet_name)
+        ws.append(header_cells(ws, columns))
+        for row, security_risk in zip(zip(*columns.values()), columns['Security_Risk']):
+            marker = get_security_risk_marker(security_risk)
+            if marker is None:
+                ws.append(row)
+                continue
+            
+            # Styled cells are built up front, so no second pass over the sheet is needed
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.fill = fills[marker]
+                cells.append(cell)
+            ws.append(cells)
+    
+    wb.save(output_file)
+
+def iter_security_sheet_rows(security_index):
+    """Yield the rows of the security sheet for the streaming writers"""
+    security_data = collect_security_data(security_index)
+    if not security_data:
+        yield ['Security Status']
+        yield ['🟢 No security issues detected!']
+        return
+    
+    yield SECURITY_COLUMNS
+    yield from security_data
+    
+    # Statistics go in a separate area of the same sheet
+    yield []
+    yield []
+    yield SECURITY_STATS_HEADER
+    yield from build_security_stats(security_index)
+
+def is_header_row(row_idx, row):
+    """Whether a 0-based sheet row gets the header style (first row or the stats header)"""
+    return row_idx == 0 or tuple(row) == SECURITY_STATS_HEADER
+
+XLSX_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+XLSX_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+XLSX_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+XLSX_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Control characters are illegal in XML 1.0; Excel stores them as _xHHHH_ escapes, so a
+# literal _xHHHH_ in the text must itself be escaped (as _x005F_xHHHH_) to survive
+XLSX_ESCAPE_SEQUENCE_RE = re.compile(r'(_x[0-9a-fA-F]{4}_)')
+XLSX_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')
+
+def xlsx_column_letter(col_idx):
+    """Convert a 0-based column index to an Excel column name (0 -> A)"""
+    letters = ''
+    col_idx += 1
+    while col_idx:
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def xlsx_escape_text(text):
+    """Encode text for an inline string cell the same way xlsxwriter does"""
+    if '_x' in text:
+        text = XLSX_ESCAPE_SEQUENCE_RE.sub(r'_x005F\1', text)
+    text = XLSX_CONTROL_CHAR_RE.sub(lambda m: f'_x{ord(m.group()):04X}_', text)
+    return escape(text)
+
+def xlsx_styles_xml():
+    """Stylesheet with one solid fill cellXf per security risk level (indices 1..n)
+    
+    The last cellXf is the header style (bold, thin border, centered), matching the
+    header format of the xlsxwriter and openpyxl writers.
+    """
+    fills = ''.join(
+        f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color}"/>'
+        f'<bgColor indexed="64"/></patternFill></fill>'
+        for _, color in SECURITY_RISK_COLORS
+    )
+    xfs = ''.join(
+        f'<xf numFmtId="0" fontId="0" fillId="{fill_id}" borderId="0" xfId="0" applyFill="1"/>'
+        for fill_id in range(2, len(SECURITY_RISK_COLORS) + 2)
+    )
+    return (
+        f'{XLSX_XML_DECL}<styleSheet xmlns="{XLSX_NS}">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        f'<fills count="{len(SECURITY_RISK_COLORS) + 2}">'
+        '<fill><patternFill patternType="none"/></fill>'
+        f'<fill><patternFill patternType="gray125"/></fill>{fills}</fills>'
+        '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+        '<border><left style="thin"><color auto="1"/></left><right style="thin"><color auto="1"/></right>'
+        '<top style="thin"><color auto="1"/></top><bottom style="thin"><color auto="1"/></bottom>'
+        '<diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(SECURITY_RISK_COLORS) + 2}">'
+        f'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>{xfs}'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" '
+        'applyAlignment="1"><alignment horizontal="center"/></xf></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+def write_xlsx_stream(sheets, output_file):
+    """Write an .xlsx by streaming worksheet XML straight into the zip archive
+    
+    ``sheets`` is an iterable of (sheet name, rows) pairs, the first row being the
+    header; each sheet is written as soon as it is produced, so rows may be lazy.
+    Rows whose Security_Risk column carries a severity marker get that level's fill.
+    This skips pandas and the per-cell object model of the Excel libraries entirely.
+    """
+    import zipfile
+    
+    style_index = {marker: idx for idx, (marker, _) in enumerate(SECURITY_RISK_COLORS, start=1)}
+    header_style = f' s="{len(SECURITY_RISK_COLORS) + 1}"'
+    sheet_names = []
+    seen_names = set()
+    
+    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for n, (name, rows) in enumerate(sheets, start=1):
+            # Excel compares sheet names case-insensitively, as do the other writers
+            if name.lower() in seen_names:
+                raise ValueError(f"Duplicate sheet name: {name!r}")
+            seen_names.add(name.lower())
+            sheet_names.append(name)
+            
+            risk_col = None
+            with zf.open(f'xl/worksheets/sheet{n}.xml', 'w') as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8') as out:
+                out.write(f'{XLSX_XML_DECL}<worksheet xmlns="{XLSX_NS}"><sheetData>')
+                for row_num, row in enumerate(rows, start=1):
+                    if row_num == 1 and 'Security_Risk' in row:
+                        risk_col = list(row).index('Security_Risk')
+                    if not row:
+                        continue
+                    
+                    style = ''
+                    if is_header_row(row_num - 1, row):
+                        style = header_style
+                    elif risk_col is not None:
+                        marker = get_security_risk_marker(str(row[risk_col]))
+                        if marker:
+                            style = f' s="{style_index[marker]}"'
+                    
+                    out.write(f'<row r="{row_num}">')
+                    for col_idx, value in enumerate(row):
+                        if value is None or value == '':
+                            continue
+                        ref = f'{xlsx_column_letter(col_idx)}{row_num}'
+                        if isinstance(value, (int, float)) and not isinstance(value, bool):
+                            out.write(f'<c r="{ref}"{style}><v>{value}</v></c>')
+                        else:
+                            out.write(f'<c r="{ref}"{style} t="inlineStr"><is>'
+                                      f'<t xml:space="preserve">{xlsx_escape_text(str(value))}</t></is></c>')
+                    out.write('</row>')
+                out.write('</sheetData></worksheet>')
         
-        stats_df = pd.DataFrame(stats_data, columns=['Category', 'Count'])
+        # Package parts list every sheet, so they are written once all sheets are known
+        sheet_overrides = ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for n in range(1, len(sheet_names) + 1)
+        )
+        zf.writestr('[Content_Types].xml', (
+            f'{XLSX_XML_DECL}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{sheet_overrides}</Types>'
+        ))
+        zf.writestr('_rels/.rels', (
+            f'{XLSX_XML_DECL}<Relationships xmlns="{XLSX_PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ))
+        zf.writestr('xl/workbook.xml', (
+            f'{XLSX_XML_DECL}<workbook xmlns="{XLSX_NS}" xmlns:r="{XLSX_REL_NS}"><sheets>'
+            + ''.join(f'<sheet name={quoteattr(name)} sheetId="{n}" r:id="rId{n}"/>'
+                      for n, name in enumerate(sheet_names, start=1))
+            + '</sheets></workbook>'
+        ))
+        zf.writestr('xl/_rels/workbook.xml.rels', (
+            f'{XLSX_XML_DECL}<Relationships xmlns="{XLSX_PKG_REL_NS}">'
+            + ''.join(f'<Relationship Id="rId{n}" Type="{XLSX_REL_NS}/worksheet" '
+                      f'Target="worksheets/sheet{n}.xml"/>'
+                      for n in range(1, len(sheet_names) + 1))
+            + f'<Relationship Id="rId{len(sheet_names) + 1}" Type="{XLSX_REL_NS}/styles" '
+              'Target="styles.xml"/></Relationships>'
+        ))
+        zf.writestr('xl/styles.xml', xlsx_styles_xml())
+
+def build_summary_data(comparison_results, security_index):
+    """Build the per-environment rows of the Summary sheet, in SUMMARY_HEADERS order"""
+    summary_data = []
+    for env_config, env_data in comparison_results.items():
+        env_security_count = security_index.by_env[env_config]
         
-        # Write to a separate area in the same sheet
-        start_row = len(security_df) + 3
-        stats_df.to_excel(writer, sheet_name='🔒 Security Issues', 
-                         startrow=start_row, index=False)
-    else:
-        # Create empty sheet with good news
-        no_issues_df = pd.DataFrame([['🟢 No security issues detected!']], 
-                                   columns=['Security Status'])
-        no_issues_df.to_excel(writer, sheet_name='🔒 Security Issues', index=False)
-
-def check_property_security_risk(prop_key, ms_values, security_issues, env_config):
-    """Check if a property has security risks"""
-    for issue_category, category_data in security_issues.items():
-        if env_config in category_data:
-            for issue in category_data[env_config]:
-                if issue['property'] == prop_key:
-                    severity_emoji = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🔵'}
-                    return f"{severity_emoji.get(issue['severity'], '⚪')} {issue['issue_type']}"
-    return ''
+        summary_data.append((
+            env_config,
+            len(env_data['microservices']),
+            env_data['total_properties'],
+            env_data['matched_count'],
+            env_data['mismatched_count'],
+            env_security_count,
+            f"{(env_data['matched_count'] / max(env_data['total_properties'], 1)) * 100:.1f}%",
+            '🔴 CRITICAL' if env_security_count > 0 else '🟢 SECURE'
+        ))
+    return summary_data
+
+def build_environment_sheets(comparison_results, risk_index, only_mismatches=False):
+    """Yield (sheet_name, columns) for every environment that has rows to show
+    
+    Each sheet is built only when the caller asks for it, so a streaming writer
+    holds one environment's columns at a time.
+    """
+    for env_config, env_data in comparison_results.items():
+        columns = build_environment_columns(env_config, env_data, risk_index, only_mismatches)
+        if columns:
+            yield env_config.replace('/', '_')[:31], columns  # Excel sheet name limit
+
+def build_environment_columns(env_config, env_data, risk_index, only_mismatches=False):
+    """Build a detailed environment sheet column by column
+    
+    Returns a dict of equal-length lists (Property, Status, Security_Risk, then one
+    per microservice), or an empty dict when there is nothing to show.
+    """
+    items = list(env_data['mismatched'].items())
+    status = ['MISMATCH'] * len(items)
+    
+    # Add matched properties (if not filtering)
+    if not only_mismatches:
+        items.extend(env_data['matching'].items())
+        status.extend(['MATCH'] * len(env_data['matching']))
+    
+    if not items:
+        return {}
+    
+    columns = {
+        'Property': [prop_key for prop_key, _ in items],
+        'Status': status,
+        'Security_Risk': [risk_index.get((env_config, prop_key), '') for prop_key, _ in items]
+    }
+    for ms in env_data['microservices']:
+        columns[ms] = [ms_values.get(ms, 'N/A') for _, ms_values in items]
+    return columns
+
+def create_security_summary_sheet(workbook, security_index, header_fmt=None):
+    """Create a dedicated security summary sheet"""
+    worksheet = workbook.add_worksheet('🔒 Security Issues')
+    for row_idx, row in enumerate(iter_security_sheet_rows(security_index)):
+        worksheet.write_row(row_idx, 0, row, header_fmt if is_header_row(row_idx, row) else None)
+
+def collect_security_data(security_index):
+    """Build the security sheet rows from the flattened security issues, in SECURITY_COLUMNS order"""
+    return [
+        (env, microservice, prop_key, category_name, issue_type, severity,
+         mask_value_for_excel(value), get_security_recommendation(issue_type))
+        for env, microservice, prop_key, category_name, issue_type, severity, value in security_index.rows
+    ]
 
+def build_security_stats(security_index):
+    """Count security issues by severity"""
+    return [
+        ['🔴 CRITICAL Issues', security_index.by_severity['HIGH']],
+        ['🟡 MEDIUM Issues', security_index.by_severity['MEDIUM']],
+        ['🔵 LOW Issues', security_index.by_severity['LOW']],
+        ['📊 Total Issues', security_index.total]
+    ]
+
+@functools.lru_cache(maxsize=4096)
 def mask_value_for_excel(value):
     """Mask sensitive values for Excel output"""
-    if 'password' in value.lower() or 'secret' in value.lower() or 'key' in value.lower():
-        if len(value) > 8:
-            return value[:4] + '*' * (len(value) - 8) + value[-4:]
-        elif len(value) > 4:
-            return value[:2] + '*' * (len(value) - 4) + value[-2:]
-        else:
-            return '*' * len(value)
+    if SENSITIVE_VALUE_RE.search(value):
+        return mask_value(value)
     return value
 
 def get_security_recommendation(issue_type):
     """Get security recommendation for each issue type"""
-    recommendations = {
-        'password': 'Use environment variables or secret management service',
-        'secret': 'Externalize to HashiCorp Vault, AWS Secrets Manager, or similar',
-        'key': 'Store in secure key management system',
-        'token': 'Use OAuth2 or JWT with external token provider',
-        'credential': 'Use service accounts or external identity providers',
-        'http_urls': 'Replace HTTP with HTTPS for secure communication',
-        'unencrypted_db': 'Enable SSL/TLS for database connections',
-        'insecure_protocols': 'Use secure protocol versions (HTTPS, TLS 1.2+)',
-        'ssl_disabled': 'Enable SSL/TLS encryption in production',
-        'debug_enabled': 'Disable debug mode in production environments',
-        'weak_encryption': 'Use strong encryption algorithms (AES-256, SHA-256+)',
-        'permissive_cors': 'Restrict CORS to specific allowed origins',
-        'no_authentication': 'Enable authentication mechanisms'
-    }
-    return recommendations.get(issue_type, 'Review and secure this configuration')
-
-def apply_security_formatting(workbook, worksheet, df):
-    """Apply conditional formatting to highlight security issues"""
-    from openpyxl.styles import PatternFill, Font
-    
-    # Define colors for different security levels
-    critical_fill = PatternFill(start_color='FFEBEE', end_color='FFEBEE', fill_type='solid')
-    medium_fill = PatternFill(start_color='FFF3E0', end_color='FFF3E0', fill_type='solid')
-    low_fill = PatternFill(start_color='E3F2FD', end_color='E3F2FD', fill_type='solid')
-    
-    # Apply formatting based on security risk column
-    security_col_idx = None
-    for idx, col in enumerate(df.columns):
-        if col == 'Security_Risk':
-            security_col_idx = idx + 1  # Excel is 1-indexed
-            break
-    
-    if security_col_idx:
-        for row_idx, row in enumerate(df.itertuples(), start=2):  # Start from row 2 (after header)
-            security_value = getattr(row, 'Security_Risk', '')
-            if '🔴' in str(security_value):
-                for col_idx in range(1, len(df.columns) + 1):
-                    worksheet.cell(row=row_idx, column=col_idx).fill = critical_fill
-            elif '🟡' in str(security_value):
-                for col_idx in range(1, len(df.columns) + 1):
-                    worksheet.cell(row=row_idx, column=col_idx).fill = medium_fill
-            elif '🔵' in str(security_value):
-                for col_idx in range(1, len(df.columns) + 1):
-                    worksheet.cell(row=row_idx, column=col_idx).fill = low_fill
-
-def print_summary(comparison_results, security_issues):
+    return SECURITY_RECOMMENDATIONS.get(issue_type, 'Review and secure this configuration')
+
+def get_security_risk_marker(security_risk):
+    """Return the severity marker found in a Security_Risk cell, if any"""
+    for marker, _ in SECURITY_RISK_COLORS:
+        if marker in security_risk:
+            return marker
+    return None
+
+def apply_security_formatting(worksheet, columns, risk_formats):
+    """Apply conditional formatting to highlight security issues (xlsxwriter)"""
+    from xlsxwriter.utility import xl_col_to_name
+    
+    if not columns.get('Security_Risk'):
+        return
+    
+    # One conditional format per level instead of styling every cell
+    risk_col = xl_col_to_name(list(columns).index('Security_Risk'))
+    cell_range = f"A2:{xl_col_to_name(len(columns) - 1)}{len(columns['Security_Risk']) + 1}"
+    for marker, fmt in risk_formats:
+        worksheet.conditional_format(cell_range, {
+            'type': 'formula',
+            'criteria': f'=ISNUMBER(SEARCH("{marker}",${risk_col}2))',
+            'format': fmt
+        })
+
+def print_summary(comparison_results, security_issues, security_index=None):
     """Print summary statistics including security"""
     total_envs = len(comparison_results)
     total_mismatches = sum(env['mismatched_count'] for env in comparison_results.values())
@@ -406,10 +749,9 @@ def print_summary(comparison_results, security_issues):
     total_properties = sum(env['total_properties'] for env in comparison_results.values())
     
     # Security statistics
-    total_critical = sum(len(issues) for issues in security_issues['hardcoded_secrets'].values())
-    total_medium = sum(len(issues) for issues in security_issues['insecure_protocols'].values())
-    total_weak = sum(len(issues) for issues in security_issues['weak_configurations'].values())
-    total_security_issues = total_critical + total_medium + total_weak
+    security_index = security_index or SecurityIndex.from_issues(security_issues)
+    total_critical, total_medium, total_weak = security_index.critical, security_index.medium, security_index.low
+    total_security_issues = security_index.total
     
     print(f"\n{'='*60}")
     print("SUMMARY")
@@ -441,67 +783,33 @@ def print_summary(comparison_results, security_issues):
     else:
         print(f"\n✅ All properties match across microservices!")
 
-def output_csv(comparison_results, output_file=None, only_mismatches=False):
-    """Output results to CSV"""
+def output_csv(comparison_results, security_issues, output_file=None, only_mismatches=False):
+    """Output results to CSV (security issues are reported in the Excel and JSON outputs)"""
     if not output_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"properties_comparison_{timestamp}.csv"
     
-    all_data = []
-    
-    for env_config, env_data in comparison_results.items():
-        microservices = env_data['microservices']
-        
-        # Add mismatched properties
-        for prop_key, ms_values in env_data['mismatched'].items():
-            for ms, value in ms_values.items():
-                all_data.append({
-                    'Environment': env_config,
-                    'Property': prop_key,
-                    'Microservice': ms,
-                    'Value': value,
-                    'Status': 'MISMATCH'
-                })
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Environment', 'Property', 'Microservice', 'Value', 'Status'])
         
-        # Add matched properties (if not filtering)
-        if not only_mismatches:
-            for prop_key, ms_values in env_data['matching'].items():
-                for ms, value in ms_values.items():
-                    all_data.append({
-                        'Environment': env_config,
-                        'Property': prop_key,
-                        'Microservice': ms,
-                        'Value': value,
-                        'Status': 'MATCH'
-                    })
-    
-    df = pd.DataFrame(all_data)
-    df.to_csv(output_file, index=False)
-    print(f"CSV output saved to: {output_file}")
-
-def print_summary(comparison_results):
-    """Print summary statistics"""
-    total_envs = len(comparison_results)
-    total_mismatches = sum(env['mismatched_count'] for env in comparison_results.values())
-    total_matches = sum(env['matched_count'] for env in comparison_results.values())
-    total_properties = sum(env['total_properties'] for env in comparison_results.values())
-    
-    print(f"\n{'='*60}")
-    print("SUMMARY")
-    print(f"{'='*60}")
-    print(f"Environments processed: {total_envs}")
-    print(f"Total properties: {total_properties}")
-    print(f"Total matches: {total_matches}")
-    print(f"Total mismatches: {total_mismatches}")
-    
-    if total_properties > 0:
-        match_percentage = (total_matches / total_properties) * 100
-        print(f"Match percentage: {match_percentage:.1f}%")
+        for env_config, env_data in comparison_results.items():
+            # Add mismatched properties
+            writer.writerows(
+                (env_config, prop_key, ms, value, 'MISMATCH')
+                for prop_key, ms_values in env_data['mismatched'].items()
+                for ms, value in ms_values.items()
+            )
+            
+            # Add matched properties (if not filtering)
+            if not only_mismatches:
+                writer.writerows(
+                    (env_config, prop_key, ms, value, 'MATCH')
+                    for prop_key, ms_values in env_data['matching'].items()
+                    for ms, value in ms_values.items()
+                )
     
-    if total_mismatches > 0:
-        print(f"\n⚠️  Found {total_mismatches} property mismatches that need attention!")
-    else:
-        print(f"\n✅ All properties match across microservices!")
+    print(f"CSV output saved to: {output_file}")
 
 if __name__ == '__main__':
     main()
@@ -533,5 +841,5 @@ python cli_compare.py --repo-url $REPO_URL \
     --microservices $MICROSERVICES_LIST \
     --github-token $GITHUB_TOKEN \
     --only-mismatches --output json | \
-    jq '.[] | select(.mismatched_count > 0)' && exit 1 || exit 0
+    jq '.comparison_results[] | select(.mismatched_count > 0)' && exit 1 || exit 0
 """
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the Excel writers in cli_utility
+Run directly or with pytest; needs openpyxl and the comparator's app module on the path
+"""
+
+import os
+import sys
+import tempfile
+
+from openpyxl import load_workbook
+
+from cli_utility import output_excel
+
+# One environment whose values include XML-illegal control characters
+COMPARISON_RESULTS = {
+    'dev/dev1': {
+        'microservices': ['orders', 'billing'],
+        'total_properties': 2,
+        'matched_count': 1,
+        'mismatched_count': 1,
+        'mismatched': {'db.url': {'orders': '\x01bad', 'billing': 'tab\there_x0041_'}},
+        'matching': {'app.name': {'orders': 'svc', 'billing': 'svc'}},
+    }
+}
+
+def write_fast_excel(comparison_results, security_issues=None):
+    """Write a report with the streaming writer and return its path"""
+    fd, output_file = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        output_excel(comparison_results, security_issues or {}, output_file, fast=True)
+    except Exception:
+        os.remove(output_file)
+        raise
+    return output_file
+
+def test_fast_excel_escapes_control_characters():
+    """Fast-path output loads in openpyxl with control characters stored as _xHHHH_ escapes"""
+    output_file = write_fast_excel(COMPARISON_RESULTS)
+    try:
+        ws = load_workbook(output_file)['dev_dev1']
+        values = [cell.value for cell in ws[2]]
+        assert values[:3] == ['db.url', 'MISMATCH', None]
+        # Same encoding xlsxwriter uses; a literal _xHHHH_ is escaped so it survives
+        assert values[3] == '_x0001_bad'
+        assert values[4] == 'tab\there_x005F_x0041_'
+    finally:
+        os.remove(output_file)
+
+def test_fast_excel_rejects_duplicate_sheet_names():
+    """An environment whose sheet name collides with another sheet is an error, not a silent overwrite"""
+    comparison_results = dict(COMPARISON_RESULTS, Summary=COMPARISON_RESULTS['dev/dev1'])
+    try:
+        os.remove(write_fast_excel(comparison_results))
+    except ValueError:
+        return
+    raise AssertionError("duplicate sheet name was accepted")
+
+def main():
+    """Run every check and report the result"""
+    checks = [test_fast_excel_escapes_control_characters, test_fast_excel_rejects_duplicate_sheet_names]
+    failed = 0
+    for check in checks:
+        try:
+            check()
+            print(f"   ✅ {check.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"   ❌ {check.__name__}: {e!r}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,12 +10,939 @@ NEW FEATURES:
 - Complete field listings without truncation
 """
 
+import io
 import json
+import logging
 import re
 import os
+import stat
+import string
+import sys
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Set, Any
-from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Any
+
+try:
+    import orjson  # C parser/serializer, much faster than json for large configs
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Value-shape patterns compiled once at import time
+DATETIME_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
+    r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}',
+    r'\d{2}/\d{2}/\d{4}\s+\d{1,2}:\d{2}',
+    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z',
+    r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}',
+)))
+
+# Millisecond (13 digits) or micro/nanosecond (16+ digits) epoch values
+UNIX_TIMESTAMP_PATTERN = re.compile(r'^(?:\d{13}|\d{16,})$')
+
+# Standard UUID with optional braces, or 32 hex digits without dashes
+UUID_PATTERN = re.compile(
+    r'^(?:[{]?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}[}]?|[0-9a-f]{32})$', re.IGNORECASE
+)
+
+# Sensitive code exceptions that should NOT be excluded as classification codes
+SENSITIVE_CODE_PATTERN = re.compile('|'.join(map(re.escape, (
+    'zipcode', 'postalcode', 'areacode', 'countrycode', 'regioncode',
+    'securitycode', 'verificationcode', 'accesscode', 'pincode',
+    'activationcode', 'confirmationcode', 'passcode', 'passwordcode',
+    'authcode', 'otpcode', 'mfacode', 'twofa', 'lockcode'
+))))
+
+# Business context suggesting a '...code' field is a system code, not sensitive data
+BUSINESS_CODE_PATTERN = re.compile('|'.join(map(re.escape, (
+    'plan', 'rate', 'product', 'service', 'status', 'error', 'result',
+    'response', 'transaction', 'campaign', 'promotion', 'offer',
+    'subscription', 'billing', 'invoice', 'payment'
+))))
+
+# Plain-string value patterns containing this month alternation have always been
+# compiled case-insensitively; configs written before the "flags" form rely on it
+LEGACY_IGNORECASE_MARKER = 'Jan|Feb|Mar'
+
+# Numbered or named backreferences inside a regex source
+BACKREFERENCE_PATTERN = re.compile(r'\\[1-9]|\(\?P=')
+
+# Keys made only of word characters contain no \b boundaries, so an exact keyword
+# match on them is plain equality
+WORD_KEY_PATTERN = re.compile(r'\w+')
+
+# Personal date keywords: 'birth' also covers dateofbirth/birthdate/birthday/birth_date,
+# 'born' covers dateborn/date_born
+PERSONAL_DATE_PATTERN = re.compile(r'dob|bday|birth|born')
+
+# Non-'code' suffixes that indicate non-sensitive enum/type fields
+CLASSIFICATION_SUFFIXES = (
+    'type', 'method', 'format', 'style', 'mode', 'kind',
+    'category', 'class', 'classification', 'scheme', 'strategy',
+    'variant', 'option', 'choice', 'selection'
+)
+
+BOOLEAN_VALUES = frozenset({
+    'true', 'false', 'yes', 'no', 'y', 'n', '1', '0',
+    'on', 'off', 'enabled', 'disabled', 'active', 'inactive',
+    'valid', 'invalid'
+})
+
+# Top-level field path segments that map directly to a field category
+FIELD_CATEGORIES = frozenset({'request', 'response', 'headers'})
+
+# Extracted data keys that are not fields (e.g. the captured curl command)
+SKIP_KEYS = frozenset({'curl'})
+
+# Static stylesheet and script for the interactive HTML report; kept out of the
+# report f-string so the braces need no escaping
+REPORT_STYLE = """        body { 
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
+            margin: 0; 
+            line-height: 1.6; 
+            background-color: #f5f7fa;
+        }
+        .container { 
+            max-width: 1600px; 
+            margin: 0 auto; 
+            background: white; 
+            min-height: 100vh;
+        }
+        .header { 
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+            color: white; 
+            padding: 30px; 
+            text-align: center;
+            position: sticky;
+            top: 0;
+            z-index: 100;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header h1 { margin: 0; font-size: 2.2em; }
+        .header h2 { margin: 10px 0 0 0; font-size: 1.3em; opacity: 0.9; }
+        
+        .stats-bar {
+            background: #2c3e50;
+            color: white;
+            padding: 15px 30px;
+            display: flex;
+            justify-content: space-around;
+            flex-wrap: wrap;
+            gap: 20px;
+        }
+        .stat-item {
+            text-align: center;
+            min-width: 120px;
+        }
+        .stat-number { 
+            font-size: 1.8em; 
+            font-weight: bold; 
+            color: #3498db;
+        }
+        .stat-label { 
+            font-size: 0.9em; 
+            opacity: 0.8;
+        }
+        
+        .tab-container {
+            background: #ecf0f1;
+            padding: 0;
+        }
+        .tabs {
+            display: flex;
+            background: #34495e;
+            margin: 0;
+            padding: 0;
+            list-style: none;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        .tab {
+            flex: 1;
+            text-align: center;
+        }
+        .tab button {
+            width: 100%;
+            padding: 20px 15px;
+            background: transparent;
+            border: none;
+            color: #bdc3c7;
+            font-size: 1.1em;
+            font-weight: 600;
+            cursor: pointer;
+            transition: all 0.3s ease;
+            border-bottom: 3px solid transparent;
+        }
+        .tab button:hover {
+            background: #2c3e50;
+            color: white;
+        }
+        .tab button.active {
+            background: #3498db;
+            color: white;
+            border-bottom-color: #e74c3c;
+        }
+        
+        .tab-content {
+            display: none;
+            padding: 30px;
+            min-height: 600px;
+        }
+        .tab-content.active {
+            display: block;
+        }
+        
+        .section-header {
+            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
+            color: white;
+            padding: 20px;
+            margin: -30px -30px 30px -30px;
+            text-align: center;
+            font-size: 1.4em;
+            font-weight: bold;
+        }
+        .section-header.value-based {
+            background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%);
+        }
+        .section-header.excluded {
+            background: linear-gradient(135deg, #27ae60 0%, #229954 100%);
+        }
+        .section-header.safe {
+            background: linear-gradient(135deg, #16a085 0%, #138d75 100%);
+        }
+        
+        table { 
+            width: 100%; 
+            border-collapse: collapse; 
+            margin: 20px 0; 
+            background: white;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            border-radius: 8px;
+            overflow: hidden;
+        }
+        th { 
+            background: #34495e;
+            color: white; 
+            padding: 15px 12px; 
+            text-align: left; 
+            font-weight: 600;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+        }
+        td { 
+            padding: 12px; 
+            border-bottom: 1px solid #ecf0f1; 
+            vertical-align: top;
+        }
+        tr:hover { 
+            background-color: #f8f9fa; 
+        }
+        tr.filtered-out,
+        tr.row-hidden {
+            display: none;
+        }
+        tr.row-removed {
+            background: #ffebee;
+            opacity: 0.6;
+        }
+        tr.row-added {
+            background: #e8f5e9;
+            opacity: 0.6;
+        }
+        
+        .field-info {
+            display: flex;
+            flex-direction: column;
+            gap: 5px;
+        }
+        .field-name { 
+            font-weight: bold; 
+            color: #2c3e50;
+            font-size: 1.1em;
+        }
+        .field-path { 
+            font-family: 'Courier New', monospace; 
+            background: #ecf0f1; 
+            padding: 4px 8px; 
+            border-radius: 4px;
+            font-size: 0.85em;
+            color: #7f8c8d;
+        }
+        .field-category {
+            font-size: 0.8em;
+            padding: 2px 8px;
+            border-radius: 12px;
+            font-weight: 500;
+            display: inline-block;
+            margin-top: 3px;
+        }
+        .field-category.headers { background: #e8f5e9; color: #2e7d32; }
+        .field-category.request { background: #e3f2fd; color: #1565c0; }
+        .field-category.response { background: #fce4ec; color: #c2185b; }
+        
+        .match-indicators {
+            display: flex;
+            gap: 5px;
+            flex-wrap: wrap;
+            margin-top: 5px;
+        }
+        .exact-match-indicator { 
+            background: #27ae60; 
+            color: white; 
+            padding: 2px 6px; 
+            border-radius: 12px; 
+            font-size: 0.7em; 
+            font-weight: bold;
+        }
+        .compound-indicator { 
+            background: #f39c12; 
+            color: white; 
+            padding: 2px 6px; 
+            border-radius: 12px; 
+            font-size: 0.7em; 
+            font-weight: bold;
+        }
+        .value-match-indicator { 
+            background: #3498db; 
+            color: white; 
+            padding: 2px 6px; 
+            border-radius: 12px; 
+            font-size: 0.7em; 
+            font-weight: bold;
+        }
+        
+        .entity-info { 
+            background: #fff3e0; 
+            padding: 8px; 
+            border-radius: 4px; 
+            margin-top: 5px;
+            font-size: 0.9em;
+            color: #e65100;
+            border-left: 3px solid #ff9800;
+        }
+        
+        .sample-values {
+            font-family: 'Courier New', monospace;
+            font-size: 0.85em;
+            background: #f8f9fa;
+            padding: 8px;
+            border-radius: 4px;
+            max-height: 80px;
+            overflow-y: auto;
+        }
+        .sample-values .value {
+            display: block;
+            padding: 2px 0;
+            color: #495057;
+        }
+        
+        .category-tags {
+            display: flex;
+            gap: 5px;
+            flex-wrap: wrap;
+        }
+        .category-tag { 
+            background: #e9ecef; 
+            color: #495057; 
+            padding: 3px 8px; 
+            border-radius: 12px; 
+            font-size: 0.8em; 
+            font-weight: 500;
+        }
+        .category-tag.spi { background: #ffebee; color: #c62828; }
+        .category-tag.cpni { background: #fff3e0; color: #ef6c00; }
+        .category-tag.rpi { background: #f3e5f5; color: #7b1fa2; }
+        .category-tag.cso { background: #e8f5e9; color: #2e7d32; }
+        .category-tag.pci { background: #ffebee; color: #c62828; }
+        
+        .action-column {
+            text-align: center;
+            min-width: 120px;
+        }
+        .btn {
+            padding: 8px 16px;
+            border: none;
+            border-radius: 5px;
+            cursor: pointer;
+            font-weight: 600;
+            font-size: 0.9em;
+            transition: all 0.3s ease;
+            margin: 2px;
+        }
+        .btn-remove {
+            background: #e74c3c;
+            color: white;
+        }
+        .btn-remove:hover {
+            background: #c0392b;
+            transform: translateY(-1px);
+        }
+        .btn-add {
+            background: #27ae60;
+            color: white;
+        }
+        .btn-add:hover {
+            background: #229954;
+            transform: translateY(-1px);
+        }
+        
+        .download-section {
+            background: #2c3e50;
+            color: white;
+            padding: 30px;
+            margin: 30px -30px -30px -30px;
+            text-align: center;
+        }
+        .btn-download {
+            background: #3498db;
+            color: white;
+            padding: 15px 30px;
+            border: none;
+            border-radius: 5px;
+            font-size: 1.1em;
+            font-weight: 600;
+            cursor: pointer;
+            margin: 10px;
+            transition: all 0.3s ease;
+        }
+        .btn-download:hover {
+            background: #2980b9;
+            transform: translateY(-2px);
+        }
+        
+        .config-output {
+            background: #2c3e50;
+            color: #ecf0f1;
+            padding: 20px;
+            border-radius: 8px;
+            font-family: 'Courier New', monospace;
+            white-space: pre-wrap;
+            margin: 20px 0;
+            font-size: 0.9em;
+            line-height: 1.4;
+        }
+        
+        .search-box {
+            width: 100%;
+            padding: 12px;
+            margin: 20px 0;
+            border: 2px solid #bdc3c7;
+            border-radius: 5px;
+            font-size: 1em;
+        }
+        .search-box:focus {
+            outline: none;
+            border-color: #3498db;
+        }
+        
+        .table-container {
+            max-height: 70vh;
+            overflow-y: auto;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            margin: 20px 0;
+        }
+        
+        .alert {
+            padding: 15px;
+            margin: 20px 0;
+            border-radius: 5px;
+            border-left: 4px solid;
+        }
+        .alert-info {
+            background: #d1ecf1;
+            border-color: #17a2b8;
+            color: #0c5460;
+        }
+        .alert-warning {
+            background: #fff3cd;
+            border-color: #ffc107;
+            color: #856404;
+        }
+        
+        .notification {
+            position: fixed;
+            bottom: 20px;
+            right: 20px;
+            z-index: 1000;
+            max-width: 400px;
+            padding: 15px 20px;
+            border-radius: 5px;
+            background: #2c3e50;
+            color: white;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+            opacity: 0;
+            pointer-events: none;
+            transition: opacity 0.3s;
+        }
+        .notification.visible {
+            opacity: 1;
+        }
+        
+        @media (max-width: 768px) {
+            .stats-bar {
+                flex-direction: column;
+                text-align: center;
+            }
+            .tabs {
+                flex-direction: column;
+            }
+            .tab-content {
+                padding: 15px;
+            }
+            table {
+                font-size: 0.8em;
+            }
+        }"""
+
+REPORT_SCRIPT = """        function openTab(evt, tabName) {
+            var i, tabcontent, tabbuttons;
+            
+            // Hide all tab contents
+            tabcontent = document.getElementsByClassName("tab-content");
+            for (i = 0; i < tabcontent.length; i++) {
+                tabcontent[i].classList.remove("active");
+            }
+            
+            // Remove active class from all tab buttons
+            tabbuttons = document.getElementsByClassName("tab-button");
+            for (i = 0; i < tabbuttons.length; i++) {
+                tabbuttons[i].classList.remove("active");
+            }
+            
+            // Show the selected tab and mark button as active
+            document.getElementById(tabName).classList.add("active");
+            evt.currentTarget.classList.add("active");
+        }
+
+        // Per table: body rows with their lowercased cell texts, captured on first search
+        const filterRowCache = new Map();
+
+        function getFilterRows(tableId) {
+            let entries = filterRowCache.get(tableId);
+            if (!entries) {
+                const tbody = document.getElementById(tableId).tBodies[0];
+                entries = Array.from(tbody.rows, row => ({
+                    row: row,
+                    cellTexts: Array.from(row.cells, cell => cell.textContent.toLowerCase())
+                }));
+                filterRowCache.set(tableId, entries);
+            }
+            return entries;
+        }
+
+        function filterTable(tableId, searchValue) {
+            const searchLower = searchValue.toLowerCase();
+            
+            for (const entry of getFilterRows(tableId)) {
+                const found = entry.cellTexts.some(text => text.includes(searchLower));
+                entry.row.classList.toggle('filtered-out', !found);
+            }
+        }
+
+        // DOM writes queued by the add/remove handlers, applied together on the next frame
+        let pendingDomUpdates = [];
+        let configDisplayPending = false;
+
+        // Config preview element, looked up once when the page loads
+        let configOutputElement = null;
+
+        function scheduleDomUpdate(update) {
+            if (pendingDomUpdates.length === 0) {
+                requestAnimationFrame(flushDomUpdates);
+            }
+            pendingDomUpdates.push(update);
+        }
+
+        function flushDomUpdates() {
+            const updates = pendingDomUpdates;
+            pendingDomUpdates = [];
+            updates.forEach(update => update());
+        }
+
+        function scheduleConfigDisplay() {
+            // Several edits in one frame only rewrite the config preview once
+            if (!configDisplayPending) {
+                configDisplayPending = true;
+                scheduleDomUpdate(() => {
+                    configDisplayPending = false;
+                    updateConfigDisplay();
+                });
+            }
+        }
+
+        // The exact match arrays arrive sorted from Python; keep them sorted with binary search
+        function lowerBound(sortedArray, value) {
+            let low = 0;
+            let high = sortedArray.length;
+            while (low < high) {
+                const mid = (low + high) >>> 1;
+                if (sortedArray[mid] < value) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
+            }
+            return low;
+        }
+
+        function insertSorted(sortedArray, value) {
+            const index = lowerBound(sortedArray, value);
+            if (sortedArray[index] !== value) {
+                sortedArray.splice(index, 0, value);
+            }
+        }
+
+        function removeSorted(sortedArray, value) {
+            const index = lowerBound(sortedArray, value);
+            if (sortedArray[index] === value) {
+                sortedArray.splice(index, 1);
+            }
+        }
+
+        // One reusable toast for add/remove feedback instead of a blocking alert per click
+        let notificationElement = null;
+        let notificationTimer = null;
+
+        function showNotification(message) {
+            if (!notificationElement) {
+                notificationElement = document.createElement('div');
+                notificationElement.className = 'notification';
+                document.body.appendChild(notificationElement);
+            }
+            notificationElement.textContent = message;
+            notificationElement.classList.add('visible');
+            clearTimeout(notificationTimer);
+            notificationTimer = setTimeout(() => notificationElement.classList.remove('visible'), 3000);
+        }
+
+        function removeField(fieldName, category, row) {
+            if (confirm(`Remove "${fieldName}" from blacklist?`)) {
+                // Add to manual whitelist, removing from manual blacklist if present
+                developerOverrides.manual_whitelist.add(fieldName);
+                developerOverrides.manual_blacklist.delete(fieldName);
+                
+                // Remove from current configuration
+                removeSorted(category === 'headers' ? exactMatchHeaders : exactMatchPayload, fieldName);
+                
+                // Update UI
+                scheduleConfigDisplay();
+                updateOverridesDisplay();
+                
+                // Hide the row or move it to another tab
+                scheduleDomUpdate(() => {
+                    row.classList.add('row-removed');
+                    setTimeout(() => row.classList.add('row-hidden'), 1000);
+                });
+                
+                showNotification(`"${fieldName}" removed from blacklist and added to developer whitelist.`);
+            }
+        }
+
+        function addField(fieldName, category, row) {
+            if (confirm(`Add "${fieldName}" to blacklist?`)) {
+                // Add to manual blacklist, removing from manual whitelist if present
+                developerOverrides.manual_blacklist.add(fieldName);
+                developerOverrides.manual_whitelist.delete(fieldName);
+                
+                // Add to current configuration
+                insertSorted(category === 'headers' ? exactMatchHeaders : exactMatchPayload, fieldName);
+                
+                // Update UI
+                scheduleConfigDisplay();
+                updateOverridesDisplay();
+                
+                // Highlight the row
+                scheduleDomUpdate(() => {
+                    row.classList.add('row-added');
+                    setTimeout(() => row.classList.add('row-hidden'), 1000);
+                });
+                
+                showNotification(`"${fieldName}" added to blacklist and developer overrides.`);
+            }
+        }
+
+        // One click listener per table body; the row carries the field name and category
+        function handleRowAction(event) {
+            const button = event.target.closest('button[data-action]');
+            if (!button) return;
+            
+            const row = button.closest('tr');
+            const handler = button.dataset.action === 'remove' ? removeField : addField;
+            handler(row.dataset.field, row.dataset.category, row);
+        }
+
+        function updateConfigDisplay() {
+            const now = new Date().toISOString().slice(0, 19).replace('T', ' ');
+            configOutputElement.textContent = `# EXACT MATCH BLACKLISTS ONLY - ${now}
+payload.blacklist=${exactMatchPayload.join(',')}
+headers.blacklist=${exactMatchHeaders.join(',')}`;
+        }
+
+        function updateOverridesDisplay() {
+            // Update stats if needed
+            console.log('Developer Overrides Updated:', developerOverrides);
+        }
+
+        function downloadConfig() {
+            const configContent = configOutputElement.textContent;
+            const blob = new Blob([configContent], { type: 'text/plain' });
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'enhanced_application.properties';
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            URL.revokeObjectURL(url);
+        }
+
+        function downloadOverrides() {
+            const overridesData = {
+                manual_blacklist: Array.from(developerOverrides.manual_blacklist),
+                manual_whitelist: Array.from(developerOverrides.manual_whitelist),
+                last_updated: new Date().toISOString().slice(0, 19).replace('T', ' '),
+                description: "Developer overrides for blacklist generation"
+            };
+            
+            const blob = new Blob([JSON.stringify(overridesData, null, 2)], { type: 'application/json' });
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'developer_overrides.json';
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            URL.revokeObjectURL(url);
+        }
+
+        function downloadReport() {
+            const blob = new Blob([document.documentElement.outerHTML], { type: 'text/html' });
+            const url = URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'interactive_blacklist_report.html';
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            URL.revokeObjectURL(url);
+        }
+
+        // Initialize page
+        document.addEventListener('DOMContentLoaded', function() {
+            configOutputElement = document.querySelector('.config-output');
+            document.querySelectorAll('.table-container tbody').forEach(tbody => {
+                tbody.addEventListener('click', handleRowAction);
+            });
+            console.log('Interactive Blacklist Report Loaded');
+            console.log('Exact Match Fields:', exactMatchPayload.length + exactMatchHeaders.length);
+        });"""
+
+# Strip indentation and blank lines once at import; neither block relies on leading
+# whitespace (the config template literal's continuation lines start at column 0)
+REPORT_STYLE = re.sub(r'^\s+', '', REPORT_STYLE, flags=re.M)
+REPORT_SCRIPT = re.sub(r'^\s+', '', REPORT_SCRIPT, flags=re.M)
+
+# Static report head through the exact match table header; parsed once at import and
+# filled with $-placeholders, so it needs no brace escaping
+REPORT_PRELUDE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Enhanced Telecom API Blacklist Analysis - Developer Interface</title>
+    <style>
+$style
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎯 Enhanced Telecom API Blacklist Analysis</h1>
+            <h2>Developer-Friendly Interface with Dynamic Field Management</h2>
+            <p>Generated: $generated</p>
+        </div>
+
+        <div class="stats-bar">
+            <div class="stat-item">
+                <div class="stat-number">$exact_count</div>
+                <div class="stat-label">Exact Match</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">$value_based_count</div>
+                <div class="stat-label">Value-Based</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">$excluded_count</div>
+                <div class="stat-label">Smart Exclusions</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">$safe_count</div>
+                <div class="stat-label">Safe Fields</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">$total_count</div>
+                <div class="stat-label">Total Fields</div>
+            </div>
+        </div>
+
+        <div class="tab-container">
+            <ul class="tabs">
+                <li class="tab">
+                    <button class="tab-button active" onclick="openTab(event, 'exact-match')">
+                        🎯 Exact Match Blacklisted ($exact_count)
+                    </button>
+                </li>
+                <li class="tab">
+                    <button class="tab-button" onclick="openTab(event, 'value-based')">
+                        🔍 Value-Based Matches ($value_based_count)
+                    </button>
+                </li>
+                <li class="tab">
+                    <button class="tab-button" onclick="openTab(event, 'excluded')">
+                        ✅ Smart Exclusions ($excluded_count)
+                    </button>
+                </li>
+                <li class="tab">
+                    <button class="tab-button" onclick="openTab(event, 'safe')">
+                        🛡️ Safe Fields ($safe_count)
+                    </button>
+                </li>
+            </ul>
+
+            <!-- Exact Match Blacklisted Tab -->
+            <div id="exact-match" class="tab-content active">
+                <div class="section-header">
+                    🎯 Exact Match Blacklisted Fields
+                    <div style="font-size: 0.8em; margin-top: 5px; opacity: 0.9;">
+                        These fields matched exact keywords and are included in the final configuration
+                    </div>
+                </div>
+                
+                <input type="text" class="search-box" placeholder="🔍 Search exact match fields..." 
+                       onkeyup="filterTable('exact-match-table', this.value)">
+                
+                <div class="table-container">
+                    <table id="exact-match-table">
+                        <thead>
+                            <tr>
+                                <th>Field Information</th>
+                                <th>Match Details</th>
+                                <th>Sample Values</th>
+                                <th>Categories</th>
+                                <th>Actions</th>
+                            </tr>
+                        </thead>
+                        <tbody>""")
+
+# Report table rows, formatted once per field. Match rows (exact and value-based) carry
+# categories and an Add/Remove action; review rows (exclusions, safe fields) always Add
+REPORT_MATCH_ROW = """
+                            <tr data-field="{field_name}" data-category="{category}">
+                                <td>{field_info}</td>
+                                <td>{details}</td>
+                                <td>{sample_values}</td>
+                                <td>{categories}</td>
+                                <td class="action-column">
+                                    {action}
+                                </td>
+                            </tr>"""
+
+REPORT_REVIEW_ROW = """
+                            <tr data-field="{field_name}" data-category="{category}">
+                                <td>{field_info}</td>
+                                <td>{details}</td>
+                                <td>{sample_values}</td>
+                                <td class="action-column">
+                                    <button class="btn btn-add" data-action="add">
+                                        ➕ Add
+                                    </button>
+                                </td>
+                            </tr>"""
+
+REPORT_REMOVE_BUTTON = """<button class="btn btn-remove" data-action="remove">
+                                        🗑️ Remove
+                                    </button>"""
+
+REPORT_ADD_BUTTON = """<button class="btn btn-add" data-action="add">
+                                        ➕ Add
+                                    </button>"""
+
+def read_json(path: str) -> Any:
+    """Load a JSON file, using orjson when installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def write_json(path: str, data: Any):
+    """Atomically write data as indented JSON, using orjson when installed"""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        # Match orjson byte for byte: UTF-8 text rather than \u escapes
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Keep the existing file's permissions; new files get the usual umask-based mode
+    if os.path.exists(path):
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    
+    # Write a uniquely named file beside the target, sync it to disk, then rename it
+    # over the target so readers never see a partial file and concurrent writers never share a temp
+    temp_file = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or '.', prefix=f".{os.path.basename(path)}.",
+                                            suffix='.tmp', delete=False)
+    try:
+        with temp_file as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_file.name, mode)
+        os.replace(temp_file.name, path)
+    except BaseException:
+        if os.path.exists(temp_file.name):
+            os.remove(temp_file.name)
+        raise
+
+def dumps_compact(data: Any) -> str:
+    """Serialize data as compact JSON text, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+def is_datetime_value(value_str: str) -> bool:
+    """Check if a single stripped value is a date-time stamp or a recent epoch timestamp"""
+    # Cheap guards before any regex: every datetime form is 15+ chars with a ':',
+    # and epoch values are 13+ digits
+    if len(value_str) < 13:
+        return False
+    
+    if ':' in value_str and DATETIME_PATTERN.search(value_str):
+        return True
+    
+    if value_str.isdigit() and UNIX_TIMESTAMP_PATTERN.match(value_str):
+        try:
+            return 1577836800000 <= int(value_str) <= 1924991999999
+        except ValueError:
+            return False
+    
+    return False
+
+def normalize_values(values: List[Any]) -> List[str]:
+    """Convert values to stripped strings once so value checks can share them"""
+    return [str(value).strip() for value in values] if values else []
 
 class EnhancedTelecomBlacklistGenerator:
     def __init__(self, patterns_file: str = 'enhanced_patterns_config.json'):
@@ -26,7 +953,6 @@ class EnhancedTelecomBlacklistGenerator:
         self.exact_keywords = {}
         self.entity_prefixes = []
         self.value_patterns = {}
-        self.fuzzy_rules = {}
         self.exclusions = set()
         self.pattern_mappings = {}
         self.value_exclusions = set()
@@ -45,49 +971,75 @@ class EnhancedTelecomBlacklistGenerator:
         # Detailed analysis for reporting - categorized
         self.exact_match_blacklisted = []
         self.value_based_blacklisted = []
+        
+        # Exact match final keys per config section, kept in step with exact_match_blacklisted
+        self.exact_match_payload = set()
+        self.exact_match_headers = set()
         self.safe_fields = []
         self.excluded_fields = []
         
         # Compiled regex patterns
         self.compiled_patterns = {}
         self.compiled_exact_patterns = {}
+        self.compiled_category_patterns = {}
+        
+        # Per category: subcategory names in the order of the category pattern's groups
+        self.category_subcategories = {}
+        
+        # Lowercased keyword -> [(category, first subcategory listing it), ...] in
+        # category order (None when unusable)
+        self.exact_keyword_lookup = None
+        
+        # Per value pattern: (name, compiled regex, is date pattern, mapped categories)
+        self.value_pattern_rules = []
         
-        # Load developer overrides first, then patterns
-        self.load_developer_overrides()
-        self.load_patterns()
+        # Union of all value patterns used to reject non-matching values in one call
+        self.value_pattern_union = None
+        
+        # Entity prefixes as one alternation followed by a camelCase/underscore boundary
+        self.entity_prefix_pattern = None
+        self.entity_prefix_lookup = {}
+        
+        # Bounded cache behind extract_entity_and_field; rebuilt whenever prefixes are recompiled
+        self.entity_split_cache = None
+        
+        # Load developer overrides first, then patterns (reusing the merged config if any)
+        merged_config = self.load_developer_overrides()
+        self.load_patterns(merged_config)
         self.compile_patterns()
     
     def load_developer_overrides(self):
-        """Load and merge developer overrides if file exists"""
+        """Load and merge developer overrides if file exists, returning the merged patterns config"""
         if os.path.exists(self.developer_overrides_file):
             try:
-                with open(self.developer_overrides_file, 'r') as f:
-                    overrides = json.load(f)
+                overrides = read_json(self.developer_overrides_file)
                 
                 self.developer_overrides = {
-                    'manual_blacklist': set(overrides.get('manual_blacklist', [])),
-                    'manual_whitelist': set(overrides.get('manual_whitelist', []))
+                    'manual_blacklist': set(map(sys.intern, overrides.get('manual_blacklist', []))),
+                    'manual_whitelist': set(map(sys.intern, overrides.get('manual_whitelist', [])))
                 }
                 
-                print(f"✅ Loaded developer overrides from {self.developer_overrides_file}")
-                print(f"   Manual blacklist: {len(self.developer_overrides['manual_blacklist'])} fields")
-                print(f"   Manual whitelist: {len(self.developer_overrides['manual_whitelist'])} fields")
+                logger.info(
+                    f"✅ Loaded developer overrides from {self.developer_overrides_file}\n"
+                    f"   Manual blacklist: {len(self.developer_overrides['manual_blacklist'])} fields\n"
+                    f"   Manual whitelist: {len(self.developer_overrides['manual_whitelist'])} fields"
+                )
                 
                 # Merge into patterns config if it exists
-                self.merge_overrides_to_patterns()
+                return self.merge_overrides_to_patterns()
                 
             except Exception as e:
-                print(f"⚠️  Error loading developer overrides: {e}")
+                logger.warning(f"⚠️  Error loading developer overrides: {e}")
                 self.developer_overrides = {'manual_blacklist': set(), 'manual_whitelist': set()}
         else:
-            print(f"📝 No existing developer overrides file found")
+            logger.info("📝 No existing developer overrides file found")
+        return None
     
     def merge_overrides_to_patterns(self):
-        """Merge developer overrides into patterns config file"""
+        """Merge developer overrides into patterns config file and return the updated config"""
         if os.path.exists(self.patterns_file):
             try:
-                with open(self.patterns_file, 'r') as f:
-                    config = json.load(f)
+                config = read_json(self.patterns_file)
                 
                 # Update developer overrides in patterns config
                 config['developer_overrides'] = {
@@ -96,13 +1048,14 @@ class EnhancedTelecomBlacklistGenerator:
                 }
                 
                 # Write back to patterns file
-                with open(self.patterns_file, 'w') as f:
-                    json.dump(config, f, indent=2)
+                write_json(self.patterns_file, config)
                 
-                print(f"🔄 Merged developer overrides into {self.patterns_file}")
+                logger.info(f"🔄 Merged developer overrides into {self.patterns_file}")
+                return config
                 
             except Exception as e:
-                print(f"⚠️  Error merging overrides to patterns: {e}")
+                logger.warning(f"⚠️  Error merging overrides to patterns: {e}")
+        return None
     
     def create_enhanced_patterns_file(self):
         """Create enhanced patterns file with extensive abbreviations and exact matching"""
@@ -346,7 +1299,7 @@ class EnhancedTelecomBlacklistGenerator:
                 "credit_card": "^\\d{4}[\\s-]?\\d{4}[\\s-]?\\d{4}[\\s-]?\\d{4}$",
                 "ssn": "^\\d{3}-\\d{2}-\\d{4}$|^\\d{9}$",
                 "date_standard": "^\\d{4}-\\d{2}-\\d{2}$|^\\d{2}/\\d{2}/\\d{4}$",
-                "date_text": "^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2}\\s+\\d{4}$",
+                "date_text": {"pattern": "^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2}\\s+\\d{4}$", "flags": "i"},
                 "date_compact": "^\\d{8}$|^\\d{6}$",
                 "coordinates": "^-?\\d+\\.?\\d*,-?\\d+\\.?\\d*$",
                 "currency": "^\\$?\\d+\\.?\\d{0,2}$",
@@ -414,87 +1367,161 @@ class EnhancedTelecomBlacklistGenerator:
             }
         }
         
-        with open(self.patterns_file, 'w') as f:
-            json.dump(enhanced_config, f, indent=2)
-        print(f"📄 Created enhanced patterns file: {self.patterns_file}")
+        write_json(self.patterns_file, enhanced_config)
+        logger.info(f"📄 Created enhanced patterns file: {self.patterns_file}")
     
-    def load_patterns(self):
-        """Load enhanced patterns from configuration file"""
+    def load_patterns(self, config: Dict[str, Any] = None):
+        """Load enhanced patterns from configuration file (or an already parsed config)"""
         try:
-            with open(self.patterns_file, 'r') as f:
-                config = json.load(f)
+            if config is None:
+                config = read_json(self.patterns_file)
             
             self.exact_keywords = config.get('exact_keywords', {})
             self.entity_prefixes = config.get('entity_prefixes', [])
             self.value_patterns = config.get('value_patterns', {})
-            self.exclusions = set(config.get('exclusions', []))
+            self.exclusions = frozenset(map(sys.intern, config.get('exclusions', [])))
             self.pattern_mappings = config.get('pattern_mappings', {})
-            self.value_exclusions = set(config.get('value_exclusions', []))
+            self.value_exclusions = frozenset(config.get('value_exclusions', []))
             self.business_value_patterns = config.get('business_value_patterns', [])
             
-            # Merge any existing developer overrides from patterns file
+            # Merge any existing developer overrides from patterns file with the loaded
+            # ones, then freeze them; the per-field checks only read them from here on
             pattern_overrides = config.get('developer_overrides', {})
-            if pattern_overrides:
-                existing_blacklist = set(pattern_overrides.get('manual_blacklist', []))
-                existing_whitelist = set(pattern_overrides.get('manual_whitelist', []))
-                
-                # Merge with loaded overrides
-                self.developer_overrides['manual_blacklist'].update(existing_blacklist)
-                self.developer_overrides['manual_whitelist'].update(existing_whitelist)
+            self.developer_overrides = {
+                key: frozenset(self.developer_overrides[key]).union(map(sys.intern, pattern_overrides.get(key, [])))
+                for key in ('manual_blacklist', 'manual_whitelist')
+            }
             
-            print(f"✅ Loaded enhanced patterns from {self.patterns_file}")
-            print(f"🎯 Entity prefixes: {len(self.entity_prefixes)}")
-            print(f"🎯 Exact keyword categories: {len(self.exact_keywords)}")
+            # Build the load report in memory and emit it as a single log record
+            report = io.StringIO()
+            report.write(f"✅ Loaded enhanced patterns from {self.patterns_file}\n")
+            report.write(f"🎯 Entity prefixes: {len(self.entity_prefixes)}\n")
+            report.write(f"🎯 Exact keyword categories: {len(self.exact_keywords)}\n")
             
-            # Print stats for each category
+            # Stats for each category
             for category, subcategories in self.exact_keywords.items():
                 total_keywords = sum(len(keywords) for keywords in subcategories.values())
-                print(f"   {category.upper()}: {total_keywords} exact keywords across {len(subcategories)} subcategories")
+                report.write(f"   {category.upper()}: {total_keywords} exact keywords across {len(subcategories)} subcategories\n")
+            logger.info(report.getvalue().rstrip('\n'))
             
         except FileNotFoundError:
-            print(f"❌ Pattern file {self.patterns_file} not found. Creating enhanced default...")
+            logger.error(f"❌ Pattern file {self.patterns_file} not found. Creating enhanced default...")
             self.create_enhanced_patterns_file()
             self.load_patterns()
         except json.JSONDecodeError as e:
-            print(f"❌ Error parsing {self.patterns_file}: {e}")
+            logger.error(f"❌ Error parsing {self.patterns_file}: {e}")
             raise
     
     def compile_patterns(self):
         """Compile regex patterns for exact word matching"""
-        # Compile value patterns
+        # Compile entity prefixes; alternation order keeps the configured prefix priority
+        self.entity_prefix_lookup = {}
+        for prefix in self.entity_prefixes:
+            self.entity_prefix_lookup.setdefault(prefix.lower(), prefix)
+        if self.entity_prefix_lookup:
+            self.entity_prefix_pattern = re.compile(
+                '(?i:' + '|'.join(map(re.escape, self.entity_prefix_lookup)) + ')(?=[A-Z_])'
+            )
+        
+        # The same keys repeat across records, so split each distinct name once (bounded per instance)
+        prefix_pattern = self.entity_prefix_pattern
+        prefix_lookup = self.entity_prefix_lookup
+        
+        def split_entity_and_field(field_name: str) -> tuple:
+            # Field starts with an entity prefix followed by a capital (camelCase) or underscore
+            match = prefix_pattern.match(field_name) if prefix_pattern else None
+            if match:
+                prefix = prefix_lookup[match.group().lower()]
+                return (prefix, field_name[match.end():].lstrip('_').lower(), True)
+            return (None, field_name.lower(), False)
+        
+        if self.entity_split_cache is not None:
+            self.entity_split_cache.cache_clear()
+        self.entity_split_cache = lru_cache(maxsize=16384)(split_entity_and_field)
+        
+        # Compile value patterns - either "regex" or {"pattern": "regex", "flags": "i"}
         for pattern_name, pattern_str in self.value_patterns.items():
             try:
-                flags = re.IGNORECASE if 'Jan|Feb|Mar' in pattern_str else 0
+                if isinstance(pattern_str, dict):
+                    flags = re.IGNORECASE if 'i' in pattern_str.get('flags', '') else 0
+                    pattern_str = pattern_str['pattern']
+                else:
+                    # Plain strings keep their original behaviour: month-name patterns ignore case
+                    flags = re.IGNORECASE if LEGACY_IGNORECASE_MARKER in pattern_str else 0
                 self.compiled_patterns[pattern_name] = re.compile(pattern_str, flags)
             except re.error as e:
-                print(f"⚠️  Invalid regex pattern '{pattern_name}': {e}")
+                logger.warning(f"⚠️  Invalid regex pattern '{pattern_name}': {e}")
+        
+        # Resolve date handling and category mappings once instead of per matched value
+        self.value_pattern_rules = [
+            (pattern_name, compiled_pattern, pattern_name.startswith('date_'),
+             self.pattern_mappings.get(pattern_name, []))
+            for pattern_name, compiled_pattern in self.compiled_patterns.items()
+        ]
+        
+        # Backreferences would be renumbered inside a union, so only build it without them
+        union_sources = [
+            f"(?i:{compiled.pattern})" if compiled.flags & re.IGNORECASE else f"(?:{compiled.pattern})"
+            for compiled in self.compiled_patterns.values()
+        ]
+        if union_sources and not any(BACKREFERENCE_PATTERN.search(source) for source in union_sources):
+            try:
+                self.value_pattern_union = re.compile('|'.join(union_sources))
+            except re.error:
+                self.value_pattern_union = None
         
         # Compile exact word matching patterns for each category
         for category, subcategories in self.exact_keywords.items():
             self.compiled_exact_patterns[category] = {}
             for subcategory, keywords in subcategories.items():
-                # Create word boundary regex for exact matching
-                escaped_keywords = [re.escape(keyword) for keyword in keywords]
+                # Create word boundary regex for exact matching; the pattern ignores case, so
+                # drop case-insensitive duplicates and try longer keywords first
+                unique_keywords = {}
+                for keyword in keywords:
+                    unique_keywords.setdefault(keyword.lower(), keyword)
+                escaped_keywords = [re.escape(keyword) for keyword in sorted(unique_keywords.values(), key=len, reverse=True)]
                 pattern = r'\b(?:' + '|'.join(escaped_keywords) + r')\b'
                 try:
                     self.compiled_exact_patterns[category][subcategory] = re.compile(pattern, re.IGNORECASE)
                 except re.error as e:
-                    print(f"⚠️  Invalid exact pattern for {category}.{subcategory}: {e}")
+                    logger.warning(f"⚠️  Invalid exact pattern for {category}.{subcategory}: {e}")
+            
+            # One alternation per category with a group per subcategory, so a single
+            # search both decides the match and (via lastindex) names the subcategory
+            subcategory_patterns = self.compiled_exact_patterns[category]
+            if subcategory_patterns:
+                self.compiled_category_patterns[category] = re.compile(
+                    '|'.join(f'({compiled.pattern})' for compiled in subcategory_patterns.values()), re.IGNORECASE
+                )
+                self.category_subcategories[category] = list(subcategory_patterns)
+        
+        # Hash lookup for word-only keys; an empty keyword list or keyword would match
+        # any key in the regex, so those configs always take the regex path
+        keyword_lists = [
+            self.exact_keywords[category][subcategory]
+            for category, subcategory_patterns in self.compiled_exact_patterns.items()
+            for subcategory in subcategory_patterns
+        ]
+        if all(keywords and all(keywords) for keywords in keyword_lists):
+            self.exact_keyword_lookup = {}
+            for category in self.compiled_category_patterns:
+                for subcategory in self.compiled_exact_patterns[category]:
+                    for keyword in self.exact_keywords[category][subcategory]:
+                        hits = self.exact_keyword_lookup.setdefault(keyword.lower(), [])
+                        if not hits or hits[-1][0] != category:
+                            hits.append((category, subcategory))
     
-    def extract_final_key(self, field_path: str) -> str:
-        """Extract the final key from a field path"""
-        if '.' in field_path:
-            return field_path.split('.')[-1]
-        return field_path
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def extract_final_key(field_path: str) -> str:
+        """Extract the final key from a field path (interned, since keys repeat across payloads)"""
+        return sys.intern(field_path.rpartition('.')[2])
     
     def get_field_category(self, field_path: str) -> str:
         """Get the category (request/response/headers) from field path"""
-        if field_path.startswith('request.'):
-            return 'request'
-        elif field_path.startswith('response.'):
-            return 'response'
-        elif field_path.startswith('headers.'):
-            return 'headers'
+        prefix, separator, _ = field_path.partition('.')
+        if separator and prefix in FIELD_CATEGORIES:
+            return prefix
         return 'unknown'
     
     def extract_entity_and_field(self, field_name: str) -> tuple:
@@ -502,26 +1529,11 @@ class EnhancedTelecomBlacklistGenerator:
         Extract entity prefix and field name from compound fields
         Returns: (entity_prefix, field_name, is_compound)
         """
-        field_lower = field_name.lower()
-        
-        # Check if field starts with any entity prefix
-        for prefix in self.entity_prefixes:
-            prefix_lower = prefix.lower()
-            if field_lower.startswith(prefix_lower) and len(field_lower) > len(prefix_lower):
-                # Extract the remaining part after prefix
-                remaining = field_lower[len(prefix_lower):]
-                # Check if remaining part starts with a capital (camelCase) or underscore
-                original_remaining = field_name[len(prefix):]
-                if (original_remaining and original_remaining[0].isupper()) or field_name[len(prefix):].startswith('_'):
-                    clean_remaining = original_remaining.lstrip('_').lower()
-                    return (prefix, clean_remaining, True)
-        
-        return (None, field_lower, False)
+        return self.entity_split_cache(field_name)
     
-    def exact_keyword_match(self, field_path: str) -> List[str]:
-        """Enhanced exact keyword matching with entity prefix support"""
-        final_key = self.extract_final_key(field_path).lower()
-        
+    def exact_keyword_match(self, final_key: str) -> List[str]:
+        """Enhanced exact keyword matching with entity prefix support (expects a lowercased final key)"""
+
         # Check developer overrides first
         if final_key in self.developer_overrides['manual_whitelist']:
             return []
@@ -534,176 +1546,89 @@ class EnhancedTelecomBlacklistGenerator:
         
         matched_categories = []
         
-        # Check exact matches for each category
-        for category, subcategories in self.compiled_exact_patterns.items():
-            category_matched = False
-            
-            for subcategory, compiled_pattern in subcategories.items():
-                # Check direct field name match
-                if compiled_pattern.search(field_name):
-                    matched_categories.append(category.upper())
-                    category_matched = True
-                    print(f"🎯 EXACT MATCH: '{final_key}' -> {category.upper()} ({subcategory})")
+        # The per-match trace is debug output; skip formatting it unless debug logging is on
+        trace = logger.isEnabledFor(logging.DEBUG)
+        
+        # Word-only keys (the common case) resolve with a single dict lookup
+        if self.exact_keyword_lookup is not None and WORD_KEY_PATTERN.fullmatch(field_name):
+            for category, subcategory in self.exact_keyword_lookup.get(field_name, ()):
+                matched_categories.append(category.upper())
+                if trace:
+                    logger.debug(f"🎯 EXACT MATCH: '{final_key}' -> {category.upper()} ({subcategory})")
                     if is_compound:
-                        print(f"   └── Compound field: entity='{entity_prefix}' + field='{field_name}'")
-                    break
+                        logger.debug(f"   └── Compound field: entity='{entity_prefix}' + field='{field_name}'")
             
-            # If compound field and no direct match, check if entity suggests sensitivity
-            if is_compound and not category_matched and entity_prefix:
-                # Check if entity prefix itself indicates personal/sensitive data
-                sensitive_entities = ['customer', 'person', 'user', 'subscriber', 'individual', 'profile']
-                if entity_prefix.lower() in sensitive_entities:
-                    # Check if the field part matches any pattern in this category
-                    for subcategory, compiled_pattern in subcategories.items():
-                        if compiled_pattern.search(field_name):
-                            matched_categories.append(category.upper())
-                            print(f"🎯 ENTITY + FIELD MATCH: '{final_key}' -> {category.upper()} (entity: {entity_prefix})")
-                            break
+            return list(set(matched_categories))
+        
+        # Check exact matches for each category
+        for category, category_pattern in self.compiled_category_patterns.items():
+            # Check direct field name match; the matching group identifies the subcategory
+            match = category_pattern.search(field_name)
+            if match:
+                subcategory = self.category_subcategories[category][match.lastindex - 1]
+                matched_categories.append(category.upper())
+                if trace:
+                    logger.debug(f"🎯 EXACT MATCH: '{final_key}' -> {category.upper()} ({subcategory})")
+                    if is_compound:
+                        logger.debug(f"   └── Compound field: entity='{entity_prefix}' + field='{field_name}'")
         
         return list(set(matched_categories))
     
-    def should_exclude(self, final_key: str) -> bool:
-        """Check if field should be excluded from blacklist"""
-        return final_key.lower() in self.exclusions
+    def should_exclude(self, field_lower: str) -> bool:
+        """Check if lowercased field should be excluded from blacklist"""
+        return field_lower in self.exclusions
     
-    def has_code_or_type_suffix(self, field_name: str) -> bool:
-        """Check if field ends with 'code' or 'type' but is NOT sensitive data"""
-        field_lower = field_name.lower()
-        
-        # Sensitive code exceptions that should NOT be excluded
-        sensitive_code_exceptions = [
-            'zipcode', 'postalcode', 'areacode', 'countrycode', 'regioncode',
-            'securitycode', 'verificationcode', 'accesscode', 'pincode',
-            'activationcode', 'confirmationcode', 'passcode', 'passwordcode',
-            'authcode', 'otpcode', 'mfacode', 'twofa', 'lockcode'
-        ]
-        
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def has_code_or_type_suffix(field_lower: str) -> bool:
+        """Check if lowercased field ends with 'code' or 'type' but is NOT sensitive data"""
         # If it's a sensitive code, don't exclude it
-        if any(exception in field_lower for exception in sensitive_code_exceptions):
+        if SENSITIVE_CODE_PATTERN.search(field_lower):
             return False
         
-        # Classification suffixes that indicate non-sensitive enum/type fields
-        classification_suffixes = [
-            'code', 'type', 'method', 'format', 'style', 'mode', 'kind',
-            'category', 'class', 'classification', 'scheme', 'strategy',
-            'variant', 'option', 'choice', 'selection'
-        ]
-        
         # Additional context-based checks for 'code' fields
         if field_lower.endswith('code'):
-            # These patterns suggest it's a business/system code, not sensitive data
-            business_code_patterns = [
-                'plan', 'rate', 'product', 'service', 'status', 'error', 'result',
-                'response', 'transaction', 'campaign', 'promotion', 'offer',
-                'subscription', 'billing', 'invoice', 'payment'
-            ]
-            
             # If it contains business context, it's likely a classification code
-            for pattern in business_code_patterns:
-                if pattern in field_lower and not any(sensitive in field_lower for sensitive in sensitive_code_exceptions):
-                    return True
-            
-            return False
+            # (sensitive codes were already ruled out above)
+            return BUSINESS_CODE_PATTERN.search(field_lower) is not None
         
         # For other suffixes, apply normal logic
-        for suffix in classification_suffixes[1:]:  # Skip 'code' since we handled it above
-            if field_lower.endswith(suffix):
-                return True
-        
-        return False
-    
-    def is_boolean_field(self, values: List[Any]) -> bool:
-        """Check if field contains only boolean-type values"""
-        if not values:
-            return False
-        
-        boolean_values = {
-            'true', 'false', 'yes', 'no', 'y', 'n', '1', '0',
-            'on', 'off', 'enabled', 'disabled', 'active', 'inactive',
-            'valid', 'invalid'
-        }
-        
-        for value in values:
-            value_str = str(value).strip().lower()
-            if value_str not in boolean_values:
-                return False
-        
-        return True
-    
-    def is_uuid_field(self, values: List[Any]) -> bool:
-        """Check if field contains only UUID values"""
-        if not values:
-            return False
-        
-        uuid_patterns = [
-            re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE),  # Standard UUID
-            re.compile(r'^[0-9a-f]{32}$', re.IGNORECASE),  # UUID without dashes
-            re.compile(r'^[{]?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}[}]?$', re.IGNORECASE)  # UUID with optional braces
-        ]
-        
-        for value in values:
-            value_str = str(value).strip()
-            if not any(pattern.match(value_str) for pattern in uuid_patterns):
-                return False
-        
-        return True
+        return field_lower.endswith(CLASSIFICATION_SUFFIXES)
     
     def has_datetime_values(self, values: List[Any]) -> bool:
-        """Check if values contain date-time stamps (not just dates)"""
-        if not values:
-            return False
-        
-        datetime_patterns = [
-            re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'),
-            re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}'),
-            re.compile(r'\d{2}/\d{2}/\d{4}\s+\d{1,2}:\d{2}'),
-            re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z'),
-            re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}'),
-        ]
-        
-        unix_timestamp_patterns = [
-            re.compile(r'^\d{13}$'),  # Milliseconds
-            re.compile(r'^\d{16,}$'),  # Microseconds or nanoseconds
-        ]
-        
-        for value in values[:3]:
-            value_str = str(value).strip()
-            
-            for pattern in datetime_patterns:
-                if pattern.search(value_str):
-                    return True
-            
-            for pattern in unix_timestamp_patterns:
-                if pattern.match(value_str):
-                    try:
-                        timestamp_val = int(value_str)
-                        if 1577836800000 <= timestamp_val <= 1924991999999:
-                            return True
-                    except ValueError:
-                        continue
-        
-        return False
-    
-    def is_personal_date_field(self, field_name: str) -> bool:
-        """Check if field name indicates a personal date (like date of birth)"""
-        field_lower = field_name.lower()
-        
-        # Extract entity and field components
-        entity_prefix, clean_field, is_compound = self.extract_entity_and_field(field_lower)
-        
-        # Check both the full field and the clean field part
-        fields_to_check = [field_lower, clean_field] if is_compound else [field_lower]
-        
-        personal_date_keywords = [
-            'dob', 'dateofbirth', 'birthdate', 'birthday', 'bday', 'birth', 'born',
-            'date_of_birth', 'birth_date', 'dateborn', 'date_born'
-        ]
+        """Check if values contain date-time stamps (not just dates)"""
+        if not values:
+            return False
         
-        for field_to_check in fields_to_check:
-            if any(keyword in field_to_check for keyword in personal_date_keywords):
-                return True
+        return any(is_datetime_value(str(value).strip()) for value in values[:3])
+    
+    def classify_values(self, values: List[str]) -> tuple:
+        """
+        Run the boolean, UUID and datetime value checks in one pass over normalized values
+        Returns: (all_boolean, all_uuid, has_datetime)
+        """
+        all_boolean = all_uuid = bool(values)
+        has_datetime = False
+        
+        for index, value_str in enumerate(values):
+            if all_boolean and value_str.lower() not in BOOLEAN_VALUES:
+                all_boolean = False
+            if all_uuid and not UUID_PATTERN.match(value_str):
+                all_uuid = False
+            # Like has_datetime_values, only the first three values are sampled
+            if index < 3 and not has_datetime and is_datetime_value(value_str):
+                has_datetime = True
+            
+            if not (all_boolean or all_uuid) and (has_datetime or index >= 2):
+                break
         
-        return False
+        return (all_boolean, all_uuid, has_datetime)
+    
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def is_personal_date_field(field_lower: str) -> bool:
+        """Check if lowercased field name indicates a personal date (like date of birth)"""
+        return PERSONAL_DATE_PATTERN.search(field_lower) is not None
     
     def analyze_values(self, values: List[Any]) -> Dict[str, Any]:
         """Enhanced value analysis with pattern matching"""
@@ -714,23 +1639,31 @@ class EnhancedTelecomBlacklistGenerator:
             'unique_values': []
         }
         
-        unique_values = list(dict.fromkeys([str(v) for v in values[:5]]))
+        # At most five samples, so a list scan beats building a dict to dedupe
+        unique_values = []
+        for value in values[:5]:
+            value_str = str(value)
+            if value_str not in unique_values:
+                unique_values.append(value_str)
         results['unique_values'] = unique_values
         
         for value in unique_values:
             value_str = str(value).strip()
             
-            for pattern_name, compiled_pattern in self.compiled_patterns.items():
+            # Most values match no pattern at all; reject those with a single match call
+            if self.value_pattern_union is not None and not self.value_pattern_union.match(value_str):
+                continue
+            
+            # Enhanced check: date patterns are skipped for values that contain time
+            is_datetime = self.has_datetime_values([value_str])
+            
+            for pattern_name, compiled_pattern, is_date_pattern, mapped_categories in self.value_pattern_rules:
                 if compiled_pattern.match(value_str):
-                    # Enhanced check: Skip date patterns if they contain time
-                    if pattern_name.startswith(('date_')):
-                        if self.has_datetime_values([value_str]):
-                            continue
+                    if is_date_pattern and is_datetime:
+                        continue
                     
                     results['patterns_found'].append(pattern_name)
-                    
-                    if pattern_name in self.pattern_mappings:
-                        results['categories'].extend(self.pattern_mappings[pattern_name])
+                    results['categories'].extend(mapped_categories)
         
         results['categories'] = list(set(results['categories']))
         results['patterns_found'] = list(set(results['patterns_found']))
@@ -740,6 +1673,16 @@ class EnhancedTelecomBlacklistGenerator:
         
         return results
     
+    def add_exact_match(self, analysis_result: Dict[str, Any]):
+        """Record an exact match and bucket its final key by config section"""
+        self.exact_match_blacklisted.append(analysis_result)
+        
+        category = analysis_result['category']
+        if category == 'headers':
+            self.exact_match_headers.add(analysis_result['final_key'])
+        elif category in ['request', 'response']:
+            self.exact_match_payload.add(analysis_result['final_key'])
+    
     def analyze_field(self, field_path: str, values: List[Any]):
         """Enhanced field analysis with exact matching and entity prefix support"""
         final_key = self.extract_final_key(field_path)
@@ -764,7 +1707,8 @@ class EnhancedTelecomBlacklistGenerator:
         developer_manual = final_key in self.developer_overrides['manual_blacklist']
         
         if developer_manual:
-            print(f"🎯 Developer override: '{final_key}' manually blacklisted")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"🎯 Developer override: '{final_key}' manually blacklisted")
             
             analysis_result = {
                 'field_path': field_path,
@@ -788,11 +1732,14 @@ class EnhancedTelecomBlacklistGenerator:
             elif category in ['request', 'response']:
                 self.payload_blacklist.add(final_key)
             
-            self.exact_match_blacklisted.append(analysis_result)
+            self.add_exact_match(analysis_result)
             return
         
+        # Key checks below are case-insensitive; lowercase once and share it
+        final_key_lower = final_key.lower()
+        
         # Standard exclusion checks
-        if self.should_exclude(final_key):
+        if self.should_exclude(final_key_lower):
             self.excluded_fields.append({
                 'field_path': field_path,
                 'final_key': final_key,
@@ -803,721 +1750,277 @@ class EnhancedTelecomBlacklistGenerator:
             })
             return
         
-        if self.has_code_or_type_suffix(final_key):
+        if self.has_code_or_type_suffix(final_key_lower):
             self.excluded_fields.append({
                 'field_path': field_path,
                 'final_key': final_key,
                 'category': category,
                 'reason': 'Excluded - Code/Type field (classification, not sensitive data)',
                 'unique_values': [str(v) for v in values[:5]] if values else [],
-                'match_type': 'exclusion'
-            })
-            return
-        
-        if self.is_boolean_field(values):
-            self.excluded_fields.append({
-                'field_path': field_path,
-                'final_key': final_key,
-                'category': category,
-                'reason': 'Excluded - Boolean field (True/False values)',
-                'unique_values': [str(v) for v in values[:5]] if values else [],
-                'match_type': 'exclusion'
-            })
-            return
-        
-        if self.is_uuid_field(values):
-            self.excluded_fields.append({
-                'field_path': field_path,
-                'final_key': final_key,
-                'category': category,
-                'reason': 'Excluded - UUID field (system identifiers)',
-                'unique_values': [str(v) for v in values[:5]] if values else [],
-                'match_type': 'exclusion'
-            })
-            return
-        
-        # Enhanced datetime exclusion (but not for personal dates)
-        if values and self.has_datetime_values(values) and not self.is_personal_date_field(final_key):
-            self.excluded_fields.append({
-                'field_path': field_path,
-                'final_key': final_key,
-                'category': category,
-                'reason': 'Excluded - Contains timestamps/datetime (not personal dates)',
-                'unique_values': [str(v) for v in values[:5]] if values else [],
-                'match_type': 'exclusion'
-            })
-            return
-        
-        # Initialize analysis result
-        entity_prefix, clean_field, is_compound = self.extract_entity_and_field(final_key)
-        
-        analysis_result = {
-            'field_path': field_path,
-            'final_key': final_key,
-            'category': category,
-            'blacklisted': False,
-            'reasons': [],
-            'categories_detected': [],
-            'unique_values': [str(v) for v in values[:5]] if values else [],
-            'confidence': 'Low',
-            'exact_match': None,
-            'entity_prefix': entity_prefix,
-            'is_compound': is_compound,
-            'clean_field': clean_field,
-            'key_based': False,
-            'value_based': False,
-            'developer_manual': False,
-            'match_type': 'no_match'
-        }
-        
-        # Enhanced exact keyword matching
-        key_categories = self.exact_keyword_match(field_path)
-        if key_categories:
-            analysis_result['key_based'] = True
-            analysis_result['categories_detected'].extend(key_categories)
-            analysis_result['exact_match'] = True
-            analysis_result['match_type'] = 'exact_match'
-            
-            if 'DEVELOPER_MANUAL' in key_categories:
-                analysis_result['reasons'].append(f"👨‍💻 Developer manually added '{final_key}' to blacklist")
-            else:
-                if is_compound:
-                    analysis_result['reasons'].append(
-                        f"🎯 EXACT MATCH: '{final_key}' = entity '{entity_prefix}' + field '{clean_field}' → {', '.join(key_categories)}"
-                    )
-                else:
-                    analysis_result['reasons'].append(
-                        f"🎯 EXACT MATCH: '{final_key}' exactly matches sensitive keywords → {', '.join(key_categories)}"
-                    )
-        
-        # Value-based analysis
-        if values:
-            value_analysis = self.analyze_values(values)
-            analysis_result['unique_values'] = value_analysis['unique_values']
-            
-            if value_analysis['categories']:
-                analysis_result['value_based'] = True
-                analysis_result['categories_detected'].extend(value_analysis['categories'])
-                analysis_result['reasons'].append(
-                    f"🔍 VALUE MATCH: Values match patterns {value_analysis['patterns_found']} → {', '.join(value_analysis['categories'])}"
-                )
-                analysis_result['confidence'] = value_analysis['confidence']
-                if not analysis_result['key_based']:
-                    analysis_result['match_type'] = 'value_based'
-        
-        # Remove duplicates
-        analysis_result['categories_detected'] = list(set(analysis_result['categories_detected']))
-        
-        # Determine if should be blacklisted
-        analysis_result['blacklisted'] = bool(analysis_result['categories_detected'])
-        
-        if not analysis_result['blacklisted']:
-            analysis_result['reasons'].append("❌ No exact matches or sensitive patterns detected")
-            analysis_result['match_type'] = 'safe'
-        
-        # Add to appropriate blacklist and category
-        if analysis_result['blacklisted']:
-            if category == 'headers':
-                self.headers_blacklist.add(final_key)
-                print(f"🔒 Added '{final_key}' to headers blacklist")
-            elif category in ['request', 'response']:
-                self.payload_blacklist.add(final_key)
-                print(f"🔒 Added '{final_key}' to payload blacklist")
-            
-            # Categorize by match type
-            if analysis_result['key_based']:
-                self.exact_match_blacklisted.append(analysis_result)
-            else:
-                self.value_based_blacklisted.append(analysis_result)
-        else:
-            self.safe_fields.append(analysis_result)
-    
-    def generate_properties(self, output_file: str = 'enhanced_application.properties'):
-        """Generate enhanced application.properties file with exact matches only"""
-        # Only include exact matches in the final configuration
-        exact_match_payload = set()
-        exact_match_headers = set()
-        
-        for result in self.exact_match_blacklisted:
-            final_key = result['final_key']
-            if result['category'] == 'headers':
-                exact_match_headers.add(final_key)
-            elif result['category'] in ['request', 'response']:
-                exact_match_payload.add(final_key)
-        
-        content = f"""# Enhanced Telecom API Blacklist Configuration - EXACT MATCHING ONLY
-# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-# Pattern source: {self.patterns_file}
-# Total fields analyzed: {len(self.exact_match_blacklisted) + len(self.value_based_blacklisted) + len(self.safe_fields)}
-# Exact match fields blacklisted: {len(self.exact_match_blacklisted)}
-# Value-based fields found: {len(self.value_based_blacklisted)}
-# Safe fields: {len(self.safe_fields)}
-# Smart exclusions: {len(self.excluded_fields)}
-
-# 🎯 CONFIGURATION INCLUDES EXACT MATCHES ONLY
-# ✅ Exact string matching (whole word boundaries) - NO FALSE POSITIVES
-# ✅ Entity prefix detection (customerAge, personName, userEmail, etc.)
-# ✅ Developer manual overrides
-# ❌ Value-based matches excluded from final config (require manual review)
-
-# EXACT MATCH BLACKLISTS ONLY
-payload.blacklist={','.join(sorted(exact_match_payload))}
-headers.blacklist={','.join(sorted(exact_match_headers))}
-"""
-        
-        with open(output_file, 'w') as f:
-            f.write(content)
-        
-        print(f"📄 Enhanced properties file generated: {output_file}")
-        print(f"📊 Exact matches only: {len(exact_match_payload)} payload + {len(exact_match_headers)} headers")
-        return output_file
-    
-    def save_developer_overrides(self, output_file: str = None):
-        """Save current developer overrides to JSON file"""
-        if output_file is None:
-            output_file = self.developer_overrides_file
-        
-        overrides_data = {
-            "manual_blacklist": list(self.developer_overrides['manual_blacklist']),
-            "manual_whitelist": list(self.developer_overrides['manual_whitelist']),
-            "last_updated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "description": "Developer overrides for blacklist generation"
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(overrides_data, f, indent=2)
-        
-        print(f"💾 Developer overrides saved to: {output_file}")
-        return output_file
-    
-    def generate_interactive_html_report(self, output_file: str = 'interactive_blacklist_report.html'):
-        """Generate interactive HTML report with tabbed interface and Add/Remove buttons"""
-        
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Enhanced Telecom API Blacklist Analysis - Developer Interface</title>
-    <style>
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            margin: 0; 
-            line-height: 1.6; 
-            background-color: #f5f7fa;
-        }}
-        .container {{ 
-            max-width: 1600px; 
-            margin: 0 auto; 
-            background: white; 
-            min-height: 100vh;
-        }}
-        .header {{ 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            padding: 30px; 
-            text-align: center;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{ margin: 0; font-size: 2.2em; }}
-        .header h2 {{ margin: 10px 0 0 0; font-size: 1.3em; opacity: 0.9; }}
-        
-        .stats-bar {{
-            background: #2c3e50;
-            color: white;
-            padding: 15px 30px;
-            display: flex;
-            justify-content: space-around;
-            flex-wrap: wrap;
-            gap: 20px;
-        }}
-        .stat-item {{
-            text-align: center;
-            min-width: 120px;
-        }}
-        .stat-number {{ 
-            font-size: 1.8em; 
-            font-weight: bold; 
-            color: #3498db;
-        }}
-        .stat-label {{ 
-            font-size: 0.9em; 
-            opacity: 0.8;
-        }}
-        
-        .tab-container {{
-            background: #ecf0f1;
-            padding: 0;
-        }}
-        .tabs {{
-            display: flex;
-            background: #34495e;
-            margin: 0;
-            padding: 0;
-            list-style: none;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        .tab {{
-            flex: 1;
-            text-align: center;
-        }}
-        .tab button {{
-            width: 100%;
-            padding: 20px 15px;
-            background: transparent;
-            border: none;
-            color: #bdc3c7;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            border-bottom: 3px solid transparent;
-        }}
-        .tab button:hover {{
-            background: #2c3e50;
-            color: white;
-        }}
-        .tab button.active {{
-            background: #3498db;
-            color: white;
-            border-bottom-color: #e74c3c;
-        }}
-        
-        .tab-content {{
-            display: none;
-            padding: 30px;
-            min-height: 600px;
-        }}
-        .tab-content.active {{
-            display: block;
-        }}
-        
-        .section-header {{
-            background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
-            color: white;
-            padding: 20px;
-            margin: -30px -30px 30px -30px;
-            text-align: center;
-            font-size: 1.4em;
-            font-weight: bold;
-        }}
-        .section-header.value-based {{
-            background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%);
-        }}
-        .section-header.excluded {{
-            background: linear-gradient(135deg, #27ae60 0%, #229954 100%);
-        }}
-        .section-header.safe {{
-            background: linear-gradient(135deg, #16a085 0%, #138d75 100%);
-        }}
+                'match_type': 'exclusion'
+            })
+            return
         
-        table {{ 
-            width: 100%; 
-            border-collapse: collapse; 
-            margin: 20px 0; 
-            background: white;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        th {{ 
-            background: #34495e;
-            color: white; 
-            padding: 15px 12px; 
-            text-align: left; 
-            font-weight: 600;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }}
-        td {{ 
-            padding: 12px; 
-            border-bottom: 1px solid #ecf0f1; 
-            vertical-align: top;
-        }}
-        tr:hover {{ 
-            background-color: #f8f9fa; 
-        }}
+        # Value checks below all work on stripped strings; build them once and classify in one pass
+        normalized_values = normalize_values(values)
+        all_boolean, all_uuid, has_datetime = self.classify_values(normalized_values)
         
-        .field-info {{
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-        }}
-        .field-name {{ 
-            font-weight: bold; 
-            color: #2c3e50;
-            font-size: 1.1em;
-        }}
-        .field-path {{ 
-            font-family: 'Courier New', monospace; 
-            background: #ecf0f1; 
-            padding: 4px 8px; 
-            border-radius: 4px;
-            font-size: 0.85em;
-            color: #7f8c8d;
-        }}
-        .field-category {{
-            font-size: 0.8em;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-weight: 500;
-            display: inline-block;
-            margin-top: 3px;
-        }}
-        .field-category.headers {{ background: #e8f5e9; color: #2e7d32; }}
-        .field-category.request {{ background: #e3f2fd; color: #1565c0; }}
-        .field-category.response {{ background: #fce4ec; color: #c2185b; }}
+        if all_boolean:
+            self.excluded_fields.append({
+                'field_path': field_path,
+                'final_key': final_key,
+                'category': category,
+                'reason': 'Excluded - Boolean field (True/False values)',
+                'unique_values': [str(v) for v in values[:5]] if values else [],
+                'match_type': 'exclusion'
+            })
+            return
         
-        .match-indicators {{
-            display: flex;
-            gap: 5px;
-            flex-wrap: wrap;
-            margin-top: 5px;
-        }}
-        .exact-match-indicator {{ 
-            background: #27ae60; 
-            color: white; 
-            padding: 2px 6px; 
-            border-radius: 12px; 
-            font-size: 0.7em; 
-            font-weight: bold;
-        }}
-        .compound-indicator {{ 
-            background: #f39c12; 
-            color: white; 
-            padding: 2px 6px; 
-            border-radius: 12px; 
-            font-size: 0.7em; 
-            font-weight: bold;
-        }}
-        .value-match-indicator {{ 
-            background: #3498db; 
-            color: white; 
-            padding: 2px 6px; 
-            border-radius: 12px; 
-            font-size: 0.7em; 
-            font-weight: bold;
-        }}
+        if all_uuid:
+            self.excluded_fields.append({
+                'field_path': field_path,
+                'final_key': final_key,
+                'category': category,
+                'reason': 'Excluded - UUID field (system identifiers)',
+                'unique_values': [str(v) for v in values[:5]] if values else [],
+                'match_type': 'exclusion'
+            })
+            return
         
-        .entity-info {{ 
-            background: #fff3e0; 
-            padding: 8px; 
-            border-radius: 4px; 
-            margin-top: 5px;
-            font-size: 0.9em;
-            color: #e65100;
-            border-left: 3px solid #ff9800;
-        }}
+        # Enhanced datetime exclusion (but not for personal dates)
+        if has_datetime and not self.is_personal_date_field(final_key_lower):
+            self.excluded_fields.append({
+                'field_path': field_path,
+                'final_key': final_key,
+                'category': category,
+                'reason': 'Excluded - Contains timestamps/datetime (not personal dates)',
+                'unique_values': [str(v) for v in values[:5]] if values else [],
+                'match_type': 'exclusion'
+            })
+            return
         
-        .sample-values {{
-            font-family: 'Courier New', monospace;
-            font-size: 0.85em;
-            background: #f8f9fa;
-            padding: 8px;
-            border-radius: 4px;
-            max-height: 80px;
-            overflow-y: auto;
-        }}
-        .sample-values .value {{
-            display: block;
-            padding: 2px 0;
-            color: #495057;
-        }}
+        # Initialize analysis result
+        entity_prefix, clean_field, is_compound = self.extract_entity_and_field(final_key)
         
-        .category-tags {{
-            display: flex;
-            gap: 5px;
-            flex-wrap: wrap;
-        }}
-        .category-tag {{ 
-            background: #e9ecef; 
-            color: #495057; 
-            padding: 3px 8px; 
-            border-radius: 12px; 
-            font-size: 0.8em; 
-            font-weight: 500;
-        }}
-        .category-tag.spi {{ background: #ffebee; color: #c62828; }}
-        .category-tag.cpni {{ background: #fff3e0; color: #ef6c00; }}
-        .category-tag.rpi {{ background: #f3e5f5; color: #7b1fa2; }}
-        .category-tag.cso {{ background: #e8f5e9; color: #2e7d32; }}
-        .category-tag.pci {{ background: #ffebee; color: #c62828; }}
-        
-        .action-column {{
-            text-align: center;
-            min-width: 120px;
-        }}
-        .btn {{
-            padding: 8px 16px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-weight: 600;
-            font-size: 0.9em;
-            transition: all 0.3s ease;
-            margin: 2px;
-        }}
-        .btn-remove {{
-            background: #e74c3c;
-            color: white;
-        }}
-        .btn-remove:hover {{
-            background: #c0392b;
-            transform: translateY(-1px);
-        }}
-        .btn-add {{
-            background: #27ae60;
-            color: white;
-        }}
-        .btn-add:hover {{
-            background: #229954;
-            transform: translateY(-1px);
-        }}
+        analysis_result = {
+            'field_path': field_path,
+            'final_key': final_key,
+            'category': category,
+            'blacklisted': False,
+            'reasons': [],
+            'categories_detected': [],
+            # Filled in by analyze_values below whenever there are values
+            'unique_values': [],
+            'confidence': 'Low',
+            'exact_match': None,
+            'entity_prefix': entity_prefix,
+            'is_compound': is_compound,
+            'clean_field': clean_field,
+            'key_based': False,
+            'value_based': False,
+            'developer_manual': False,
+            'match_type': 'no_match'
+        }
         
-        .download-section {{
-            background: #2c3e50;
-            color: white;
-            padding: 30px;
-            margin: 30px -30px -30px -30px;
-            text-align: center;
-        }}
-        .btn-download {{
-            background: #3498db;
-            color: white;
-            padding: 15px 30px;
-            border: none;
-            border-radius: 5px;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            margin: 10px;
-            transition: all 0.3s ease;
-        }}
-        .btn-download:hover {{
-            background: #2980b9;
-            transform: translateY(-2px);
-        }}
+        # Enhanced exact keyword matching
+        key_categories = self.exact_keyword_match(final_key_lower)
+        if key_categories:
+            analysis_result['key_based'] = True
+            analysis_result['categories_detected'].extend(key_categories)
+            analysis_result['exact_match'] = True
+            analysis_result['match_type'] = 'exact_match'
+            
+            if 'DEVELOPER_MANUAL' in key_categories:
+                analysis_result['reasons'].append(f"👨‍💻 Developer manually added '{final_key}' to blacklist")
+            else:
+                if is_compound:
+                    analysis_result['reasons'].append(
+                        f"🎯 EXACT MATCH: '{final_key}' = entity '{entity_prefix}' + field '{clean_field}' → {', '.join(key_categories)}"
+                    )
+                else:
+                    analysis_result['reasons'].append(
+                        f"🎯 EXACT MATCH: '{final_key}' exactly matches sensitive keywords → {', '.join(key_categories)}"
+                    )
         
-        .config-output {{
-            background: #2c3e50;
-            color: #ecf0f1;
-            padding: 20px;
-            border-radius: 8px;
-            font-family: 'Courier New', monospace;
-            white-space: pre-wrap;
-            margin: 20px 0;
-            font-size: 0.9em;
-            line-height: 1.4;
-        }}
+        # Value-based analysis
+        if values:
+            value_analysis = self.analyze_values(values)
+            analysis_result['unique_values'] = value_analysis['unique_values']
+            
+            if value_analysis['categories']:
+                analysis_result['value_based'] = True
+                analysis_result['categories_detected'].extend(value_analysis['categories'])
+                analysis_result['reasons'].append(
+                    f"🔍 VALUE MATCH: Values match patterns {value_analysis['patterns_found']} → {', '.join(value_analysis['categories'])}"
+                )
+                analysis_result['confidence'] = value_analysis['confidence']
+                if not analysis_result['key_based']:
+                    analysis_result['match_type'] = 'value_based'
         
-        .search-box {{
-            width: 100%;
-            padding: 12px;
-            margin: 20px 0;
-            border: 2px solid #bdc3c7;
-            border-radius: 5px;
-            font-size: 1em;
-        }}
-        .search-box:focus {{
-            outline: none;
-            border-color: #3498db;
-        }}
+        # Remove duplicates
+        analysis_result['categories_detected'] = list(set(analysis_result['categories_detected']))
         
-        .table-container {{
-            max-height: 70vh;
-            overflow-y: auto;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        # Determine if should be blacklisted
+        analysis_result['blacklisted'] = bool(analysis_result['categories_detected'])
         
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            margin: 20px 0;
-        }}
+        if not analysis_result['blacklisted']:
+            analysis_result['reasons'].append("❌ No exact matches or sensitive patterns detected")
+            analysis_result['match_type'] = 'safe'
+        
+        # Add to appropriate blacklist and category
+        if analysis_result['blacklisted']:
+            if category == 'headers':
+                self.headers_blacklist.add(final_key)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"🔒 Added '{final_key}' to headers blacklist")
+            elif category in ['request', 'response']:
+                self.payload_blacklist.add(final_key)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"🔒 Added '{final_key}' to payload blacklist")
+            
+            # Categorize by match type
+            if analysis_result['key_based']:
+                self.add_exact_match(analysis_result)
+            else:
+                self.value_based_blacklisted.append(analysis_result)
+        else:
+            self.safe_fields.append(analysis_result)
+    
+    def exact_match_keys(self) -> tuple:
+        """
+        Exact match final keys split into payload and header keys
+        Returns: (sorted payload keys, sorted header keys)
+        """
+        return (sorted(self.exact_match_payload), sorted(self.exact_match_headers))
+    
+    def generate_properties(self, output_file: str = 'enhanced_application.properties'):
+        """Generate enhanced application.properties file with exact matches only"""
+        # Only include exact matches in the final configuration
+        exact_match_payload, exact_match_headers = self.exact_match_keys()
         
-        .alert {{
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 5px;
-            border-left: 4px solid;
-        }}
-        .alert-info {{
-            background: #d1ecf1;
-            border-color: #17a2b8;
-            color: #0c5460;
-        }}
-        .alert-warning {{
-            background: #fff3cd;
-            border-color: #ffc107;
-            color: #856404;
-        }}
+        exact_count = len(self.exact_match_blacklisted)
+        value_based_count = len(self.value_based_blacklisted)
+        safe_count = len(self.safe_fields)
         
-        @media (max-width: 768px) {{
-            .stats-bar {{
-                flex-direction: column;
-                text-align: center;
-            }}
-            .tabs {{
-                flex-direction: column;
-            }}
-            .tab-content {{
-                padding: 15px;
-            }}
-            table {{
-                font-size: 0.8em;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎯 Enhanced Telecom API Blacklist Analysis</h1>
-            <h2>Developer-Friendly Interface with Dynamic Field Management</h2>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-
-        <div class="stats-bar">
-            <div class="stat-item">
-                <div class="stat-number">{len(self.exact_match_blacklisted)}</div>
-                <div class="stat-label">Exact Match</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{len(self.value_based_blacklisted)}</div>
-                <div class="stat-label">Value-Based</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{len(self.excluded_fields)}</div>
-                <div class="stat-label">Smart Exclusions</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{len(self.safe_fields)}</div>
-                <div class="stat-label">Safe Fields</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{len(self.exact_match_blacklisted) + len(self.value_based_blacklisted) + len(self.excluded_fields) + len(self.safe_fields)}</div>
-                <div class="stat-label">Total Fields</div>
-            </div>
-        </div>
+        content = f"""# Enhanced Telecom API Blacklist Configuration - EXACT MATCHING ONLY
+# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+# Pattern source: {self.patterns_file}
+# Total fields analyzed: {exact_count + value_based_count + safe_count}
+# Exact match fields blacklisted: {exact_count}
+# Value-based fields found: {value_based_count}
+# Safe fields: {safe_count}
+# Smart exclusions: {len(self.excluded_fields)}
 
-        <div class="tab-container">
-            <ul class="tabs">
-                <li class="tab">
-                    <button class="tab-button active" onclick="openTab(event, 'exact-match')">
-                        🎯 Exact Match Blacklisted ({len(self.exact_match_blacklisted)})
-                    </button>
-                </li>
-                <li class="tab">
-                    <button class="tab-button" onclick="openTab(event, 'value-based')">
-                        🔍 Value-Based Matches ({len(self.value_based_blacklisted)})
-                    </button>
-                </li>
-                <li class="tab">
-                    <button class="tab-button" onclick="openTab(event, 'excluded')">
-                        ✅ Smart Exclusions ({len(self.excluded_fields)})
-                    </button>
-                </li>
-                <li class="tab">
-                    <button class="tab-button" onclick="openTab(event, 'safe')">
-                        🛡️ Safe Fields ({len(self.safe_fields)})
-                    </button>
-                </li>
-            </ul>
+# 🎯 CONFIGURATION INCLUDES EXACT MATCHES ONLY
+# ✅ Exact string matching (whole word boundaries) - NO FALSE POSITIVES
+# ✅ Entity prefix detection (customerAge, personName, userEmail, etc.)
+# ✅ Developer manual overrides
+# ❌ Value-based matches excluded from final config (require manual review)
 
-            <!-- Exact Match Blacklisted Tab -->
-            <div id="exact-match" class="tab-content active">
-                <div class="section-header">
-                    🎯 Exact Match Blacklisted Fields
-                    <div style="font-size: 0.8em; margin-top: 5px; opacity: 0.9;">
-                        These fields matched exact keywords and are included in the final configuration
-                    </div>
-                </div>
-                
-                <input type="text" class="search-box" placeholder="🔍 Search exact match fields..." 
-                       onkeyup="filterTable('exact-match-table', this.value)">
-                
-                <div class="table-container">
-                    <table id="exact-match-table">
-                        <thead>
-                            <tr>
-                                <th>Field Information</th>
-                                <th>Match Details</th>
-                                <th>Sample Values</th>
-                                <th>Categories</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>"""
+# EXACT MATCH BLACKLISTS ONLY
+payload.blacklist={','.join(exact_match_payload)}
+headers.blacklist={','.join(exact_match_headers)}
+"""
+        
+        with open(output_file, 'w') as f:
+            f.write(content)
+        
+        print(f"📄 Enhanced properties file generated: {output_file}")
+        print(f"📊 Exact matches only: {len(exact_match_payload)} payload + {len(exact_match_headers)} headers")
+        return output_file
+    
+    def save_developer_overrides(self, output_file: str = None):
+        """Save current developer overrides to JSON file"""
+        if output_file is None:
+            output_file = self.developer_overrides_file
+        
+        overrides_data = {
+            "manual_blacklist": list(self.developer_overrides['manual_blacklist']),
+            "manual_whitelist": list(self.developer_overrides['manual_whitelist']),
+            "last_updated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "description": "Developer overrides for blacklist generation"
+        }
+        
+        write_json(output_file, overrides_data)
+        
+        print(f"💾 Developer overrides saved to: {output_file}")
+        return output_file
+    
+    def iter_html_report(self):
+        """Yield the interactive HTML report in fragments, in document order"""
+        # Exact match payload and headers for config; the same sorted lists feed the
+        # config preview, and their JSON is serialized once for the script data
+        exact_match_payload, exact_match_headers = self.exact_match_keys()
+        payload_json = dumps_compact(exact_match_payload)
+        headers_json = dumps_compact(exact_match_headers)
+        
+        # Report head: styles, summary stats, tab bar and the exact match table header
+        exact_count = len(self.exact_match_blacklisted)
+        value_based_count = len(self.value_based_blacklisted)
+        excluded_count = len(self.excluded_fields)
+        safe_count = len(self.safe_fields)
+        yield REPORT_PRELUDE.substitute(
+            style=REPORT_STYLE,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            exact_count=exact_count,
+            value_based_count=value_based_count,
+            excluded_count=excluded_count,
+            safe_count=safe_count,
+            total_count=exact_count + value_based_count + excluded_count + safe_count
+        )
 
         # Generate Exact Match table rows
         for result in self.exact_match_blacklisted:
             field_name = result['final_key']
             field_path = result['field_path']
             category = result['category']
+            is_compound = result.get('is_compound')
+            unique_values = result['unique_values']
+            categories_detected = result['categories_detected']
+            
+            # Field Information column; compound fields add an indicator and the entity split
+            compound_indicator = ''
+            entity_info = ''
+            if is_compound:
+                compound_indicator = '<span class="compound-indicator">COMPOUND</span>'
+                entity_info = f"""
+                    <div class="entity-info">
+                        Entity: <strong>{result.get('entity_prefix', 'N/A')}</strong> + 
+                        Field: <strong>{result.get('clean_field', 'N/A')}</strong>
+                    </div>"""
             
-            # Field Information column
             field_info = f"""
                 <div class="field-info">
                     <div class="field-name">{field_name}</div>
                     <div class="field-path">{field_path}</div>
                     <div class="field-category {category}">{category.upper()}</div>
                     <div class="match-indicators">
-                        <span class="exact-match-indicator">EXACT MATCH</span>"""
-            
-            if result.get('is_compound'):
-                field_info += f'<span class="compound-indicator">COMPOUND</span>'
-            
-            field_info += '</div>'
-            
-            if result.get('is_compound'):
-                field_info += f"""
-                    <div class="entity-info">
-                        Entity: <strong>{result.get('entity_prefix', 'N/A')}</strong> + 
-                        Field: <strong>{result.get('clean_field', 'N/A')}</strong>
-                    </div>"""
-            
-            field_info += '</div>'
+                        <span class="exact-match-indicator">EXACT MATCH</span>{compound_indicator}</div>{entity_info}</div>"""
             
             # Match Details column
             match_details = '<br>'.join(result['reasons'])
             
             # Sample Values column
             sample_values = ''
-            if result['unique_values']:
-                sample_values = '<div class="sample-values">'
-                for value in result['unique_values']:
-                    sample_values += f'<span class="value">{value}</span>'
-                sample_values += '</div>'
+            if unique_values:
+                sample_values = '<div class="sample-values">' + ''.join(
+                    f'<span class="value">{value}</span>' for value in unique_values
+                ) + '</div>'
             
             # Categories column
             categories = ''
-            if result['categories_detected']:
-                categories = '<div class="category-tags">'
-                for cat in result['categories_detected']:
-                    if cat != 'DEVELOPER_MANUAL':
-                        categories += f'<span class="category-tag {cat.lower()}">{cat}</span>'
-                categories += '</div>'
+            if categories_detected:
+                categories = '<div class="category-tags">' + ''.join(
+                    f'<span class="category-tag {cat.lower()}">{cat}</span>'
+                    for cat in categories_detected if cat != 'DEVELOPER_MANUAL'
+                ) + '</div>'
             
-            html_content += f"""
-                            <tr data-field="{field_name}" data-category="{category}">
-                                <td>{field_info}</td>
-                                <td>{match_details}</td>
-                                <td>{sample_values}</td>
-                                <td>{categories}</td>
-                                <td class="action-column">
-                                    <button class="btn btn-remove" onclick="removeField('{field_name}', '{category}')">
-                                        🗑️ Remove
-                                    </button>
-                                </td>
-                            </tr>"""
+            yield REPORT_MATCH_ROW.format(
+                field_name=field_name, category=category, field_info=field_info, details=match_details,
+                sample_values=sample_values, categories=categories, action=REPORT_REMOVE_BUTTON
+            )
 
-        html_content += """
+        yield """
                         </tbody>
                     </table>
                 </div>
@@ -1553,6 +2056,8 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             field_name = result['final_key']
             field_path = result['field_path']
             category = result['category']
+            unique_values = result['unique_values']
+            categories_detected = result['categories_detected']
             
             # Field Information column
             field_info = f"""
@@ -1570,34 +2075,25 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             
             # Sample Values column
             sample_values = ''
-            if result['unique_values']:
-                sample_values = '<div class="sample-values">'
-                for value in result['unique_values']:
-                    sample_values += f'<span class="value">{value}</span>'
-                sample_values += '</div>'
+            if unique_values:
+                sample_values = '<div class="sample-values">' + ''.join(
+                    f'<span class="value">{value}</span>' for value in unique_values
+                ) + '</div>'
             
             # Categories column
             categories = ''
-            if result['categories_detected']:
-                categories = '<div class="category-tags">'
-                for cat in result['categories_detected']:
-                    categories += f'<span class="category-tag {cat.lower()}">{cat}</span>'
-                categories += '</div>'
+            if categories_detected:
+                categories = '<div class="category-tags">' + ''.join(
+                    f'<span class="category-tag {cat.lower()}">{cat}</span>'
+                    for cat in categories_detected
+                ) + '</div>'
             
-            html_content += f"""
-                            <tr data-field="{field_name}" data-category="{category}">
-                                <td>{field_info}</td>
-                                <td>{match_details}</td>
-                                <td>{sample_values}</td>
-                                <td>{categories}</td>
-                                <td class="action-column">
-                                    <button class="btn btn-add" onclick="addField('{field_name}', '{category}')">
-                                        ➕ Add
-                                    </button>
-                                </td>
-                            </tr>"""
+            yield REPORT_MATCH_ROW.format(
+                field_name=field_name, category=category, field_info=field_info, details=match_details,
+                sample_values=sample_values, categories=categories, action=REPORT_ADD_BUTTON
+            )
 
-        html_content += """
+        yield """
                         </tbody>
                     </table>
                 </div>
@@ -1632,6 +2128,7 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             field_name = exclusion['final_key']
             field_path = exclusion['field_path']
             category = exclusion.get('category', 'unknown')
+            unique_values = exclusion.get('unique_values')
             
             # Field Information column
             field_info = f"""
@@ -1643,25 +2140,17 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             
             # Sample Values column
             sample_values = ''
-            if exclusion.get('unique_values'):
-                sample_values = '<div class="sample-values">'
-                for value in exclusion['unique_values']:
-                    sample_values += f'<span class="value">{value}</span>'
-                sample_values += '</div>'
+            if unique_values:
+                sample_values = '<div class="sample-values">' + ''.join(
+                    f'<span class="value">{value}</span>' for value in unique_values
+                ) + '</div>'
             
-            html_content += f"""
-                            <tr data-field="{field_name}" data-category="{category}">
-                                <td>{field_info}</td>
-                                <td>{exclusion['reason']}</td>
-                                <td>{sample_values}</td>
-                                <td class="action-column">
-                                    <button class="btn btn-add" onclick="addField('{field_name}', '{category}')">
-                                        ➕ Add
-                                    </button>
-                                </td>
-                            </tr>"""
+            yield REPORT_REVIEW_ROW.format(
+                field_name=field_name, category=category, field_info=field_info,
+                details=exclusion['reason'], sample_values=sample_values
+            )
 
-        html_content += """
+        yield """
                         </tbody>
                     </table>
                 </div>
@@ -1696,6 +2185,8 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             field_name = result['final_key']
             field_path = result['field_path']
             category = result['category']
+            reasons = result['reasons']
+            unique_values = result['unique_values']
             
             # Field Information column
             field_info = f"""
@@ -1706,48 +2197,29 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
                 </div>"""
             
             # Analysis Result column
-            analysis_result = result['reasons'][0] if result['reasons'] else 'No sensitive patterns detected'
+            analysis_result = reasons[0] if reasons else 'No sensitive patterns detected'
             
             # Sample Values column
             sample_values = ''
-            if result['unique_values']:
-                sample_values = '<div class="sample-values">'
-                for value in result['unique_values']:
-                    sample_values += f'<span class="value">{value}</span>'
-                sample_values += '</div>'
+            if unique_values:
+                sample_values = '<div class="sample-values">' + ''.join(
+                    f'<span class="value">{value}</span>' for value in unique_values
+                ) + '</div>'
             
-            html_content += f"""
-                            <tr data-field="{field_name}" data-category="{category}">
-                                <td>{field_info}</td>
-                                <td>{analysis_result}</td>
-                                <td>{sample_values}</td>
-                                <td class="action-column">
-                                    <button class="btn btn-add" onclick="addField('{field_name}', '{category}')">
-                                        ➕ Add
-                                    </button>
-                                </td>
-                            </tr>"""
+            yield REPORT_REVIEW_ROW.format(
+                field_name=field_name, category=category, field_info=field_info,
+                details=analysis_result, sample_values=sample_values
+            )
 
         if len(self.safe_fields) > 50:
-            html_content += f"""
+            yield f"""
                             <tr>
                                 <td colspan="4" style="text-align: center; font-style: italic; color: #666; padding: 20px;">
                                     ... and {len(self.safe_fields) - 50} more safe fields
                                 </td>
                             </tr>"""
 
-        # Generate exact match payload and headers for config
-        exact_match_payload = []
-        exact_match_headers = []
-        
-        for result in self.exact_match_blacklisted:
-            final_key = result['final_key']
-            if result['category'] == 'headers':
-                exact_match_headers.append(final_key)
-            elif result['category'] in ['request', 'response']:
-                exact_match_payload.append(final_key)
-
-        html_content += f"""
+        yield f"""
                         </tbody>
                     </table>
                 </div>
@@ -1764,8 +2236,8 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
             
             <div class="config-output">
 # EXACT MATCH BLACKLISTS ONLY - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-payload.blacklist={','.join(sorted(exact_match_payload))}
-headers.blacklist={','.join(sorted(exact_match_headers))}
+payload.blacklist={','.join(exact_match_payload)}
+headers.blacklist={','.join(exact_match_headers)}
             </div>
             
             <button class="btn-download" onclick="downloadConfig()">
@@ -1781,205 +2253,27 @@ headers.blacklist={','.join(sorted(exact_match_headers))}
     </div>
 
     <script>
-        // Developer overrides data
+        // Developer overrides data; Sets give constant-time membership on every click
         let developerOverrides = {{
-            manual_blacklist: [],
-            manual_whitelist: []
+            manual_blacklist: new Set(),
+            manual_whitelist: new Set()
         }};
 
         // Current configuration data
-        let exactMatchPayload = {json.dumps(sorted(exact_match_payload))};
-        let exactMatchHeaders = {json.dumps(sorted(exact_match_headers))};
-
-        function openTab(evt, tabName) {{
-            var i, tabcontent, tabbuttons;
-            
-            // Hide all tab contents
-            tabcontent = document.getElementsByClassName("tab-content");
-            for (i = 0; i < tabcontent.length; i++) {{
-                tabcontent[i].classList.remove("active");
-            }}
-            
-            // Remove active class from all tab buttons
-            tabbuttons = document.getElementsByClassName("tab-button");
-            for (i = 0; i < tabbuttons.length; i++) {{
-                tabbuttons[i].classList.remove("active");
-            }}
-            
-            // Show the selected tab and mark button as active
-            document.getElementById(tabName).classList.add("active");
-            evt.currentTarget.classList.add("active");
-        }}
-
-        function filterTable(tableId, searchValue) {{
-            const table = document.getElementById(tableId);
-            const rows = table.getElementsByTagName("tr");
-            const searchLower = searchValue.toLowerCase();
-            
-            for (let i = 1; i < rows.length; i++) {{ // Skip header row
-                const row = rows[i];
-                const cells = row.getElementsByTagName("td");
-                let found = false;
-                
-                for (let j = 0; j < cells.length; j++) {{
-                    if (cells[j].textContent.toLowerCase().includes(searchLower)) {{
-                        found = true;
-                        break;
-                    }}
-                }}
-                
-                row.style.display = found ? "" : "none";
-            }}
-        }}
-
-        function removeField(fieldName, category) {{
-            if (confirm(`Remove "${{fieldName}}" from blacklist?`)) {{
-                // Add to manual whitelist
-                if (!developerOverrides.manual_whitelist.includes(fieldName)) {{
-                    developerOverrides.manual_whitelist.push(fieldName);
-                }}
-                
-                // Remove from manual blacklist if present
-                const blacklistIndex = developerOverrides.manual_blacklist.indexOf(fieldName);
-                if (blacklistIndex > -1) {{
-                    developerOverrides.manual_blacklist.splice(blacklistIndex, 1);
-                }}
-                
-                // Remove from current configuration
-                if (category === 'headers') {{
-                    const index = exactMatchHeaders.indexOf(fieldName);
-                    if (index > -1) exactMatchHeaders.splice(index, 1);
-                }} else {{
-                    const index = exactMatchPayload.indexOf(fieldName);
-                    if (index > -1) exactMatchPayload.splice(index, 1);
-                }}
-                
-                // Update UI
-                updateConfigDisplay();
-                updateOverridesDisplay();
-                
-                // Hide the row or move it to another tab
-                const row = document.querySelector(`tr[data-field="${{fieldName}}"]`);
-                if (row) {{
-                    row.style.background = '#ffebee';
-                    row.style.opacity = '0.6';
-                    setTimeout(() => row.style.display = 'none', 1000);
-                }}
-                
-                alert(`"${{fieldName}}" removed from blacklist and added to developer whitelist.`);
-            }}
-        }}
-
-        function addField(fieldName, category) {{
-            if (confirm(`Add "${{fieldName}}" to blacklist?`)) {{
-                // Add to manual blacklist
-                if (!developerOverrides.manual_blacklist.includes(fieldName)) {{
-                    developerOverrides.manual_blacklist.push(fieldName);
-                }}
-                
-                // Remove from manual whitelist if present
-                const whitelistIndex = developerOverrides.manual_whitelist.indexOf(fieldName);
-                if (whitelistIndex > -1) {{
-                    developerOverrides.manual_whitelist.splice(whitelistIndex, 1);
-                }}
-                
-                // Add to current configuration
-                if (category === 'headers') {{
-                    if (!exactMatchHeaders.includes(fieldName)) {{
-                        exactMatchHeaders.push(fieldName);
-                        exactMatchHeaders.sort();
-                    }}
-                }} else {{
-                    if (!exactMatchPayload.includes(fieldName)) {{
-                        exactMatchPayload.push(fieldName);
-                        exactMatchPayload.sort();
-                    }}
-                }}
-                
-                // Update UI
-                updateConfigDisplay();
-                updateOverridesDisplay();
-                
-                // Highlight the row
-                const row = document.querySelector(`tr[data-field="${{fieldName}}"]`);
-                if (row) {{
-                    row.style.background = '#e8f5e9';
-                    row.style.opacity = '0.6';
-                    setTimeout(() => row.style.display = 'none', 1000);
-                }}
-                
-                alert(`"${{fieldName}}" added to blacklist and developer overrides.`);
-            }}
-        }}
-
-        function updateConfigDisplay() {{
-            const configElement = document.querySelector('.config-output');
-            const now = new Date().toISOString().slice(0, 19).replace('T', ' ');
-            configElement.textContent = `# EXACT MATCH BLACKLISTS ONLY - ${{now}}
-payload.blacklist=${{exactMatchPayload.join(',')}}
-headers.blacklist=${{exactMatchHeaders.join(',')}}`;
-        }}
-
-        function updateOverridesDisplay() {{
-            // Update stats if needed
-            console.log('Developer Overrides Updated:', developerOverrides);
-        }}
-
-        function downloadConfig() {{
-            const configContent = document.querySelector('.config-output').textContent;
-            const blob = new Blob([configContent], {{ type: 'text/plain' }});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'enhanced_application.properties';
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            URL.revokeObjectURL(url);
-        }}
-
-        function downloadOverrides() {{
-            const overridesData = {{
-                ...developerOverrides,
-                last_updated: new Date().toISOString().slice(0, 19).replace('T', ' '),
-                description: "Developer overrides for blacklist generation"
-            }};
-            
-            const blob = new Blob([JSON.stringify(overridesData, null, 2)], {{ type: 'application/json' }});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'developer_overrides.json';
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            URL.revokeObjectURL(url);
-        }}
-
-        function downloadReport() {{
-            const blob = new Blob([document.documentElement.outerHTML], {{ type: 'text/html' }});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'interactive_blacklist_report.html';
-            document.body.appendChild(a);
-            a.click();
-            document.body.removeChild(a);
-            URL.revokeObjectURL(url);
-        }}
+        let exactMatchPayload = {payload_json};
+        let exactMatchHeaders = {headers_json};
 
-        // Initialize page
-        document.addEventListener('DOMContentLoaded', function() {{
-            console.log('Interactive Blacklist Report Loaded');
-            console.log('Exact Match Fields:', exactMatchPayload.length + exactMatchHeaders.length);
-        }});
+{REPORT_SCRIPT}
     </script>
 </body>
 </html>
 """
-
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+    
+    def generate_interactive_html_report(self, output_file: str = 'interactive_blacklist_report.html'):
+        """Generate interactive HTML report with tabbed interface and Add/Remove buttons"""
+        # Stream fragments straight to the file rather than building the whole document in memory
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.writelines(self.iter_html_report())
         
         print(f"📄 Interactive HTML report generated: {output_file}")
         return output_file
@@ -2001,9 +2295,14 @@ headers.blacklist=${{exactMatchHeaders.join(',')}}`;
         print(f"   ✅ Smart exclusions: {len(self.excluded_fields)}")
         print(f"   🛡️ Safe fields: {len(self.safe_fields)}")
         
-        # Calculate final configuration counts
-        exact_payload = len([r for r in self.exact_match_blacklisted if r['category'] in ['request', 'response']])
-        exact_headers = len([r for r in self.exact_match_blacklisted if r['category'] == 'headers'])
+        # Calculate final configuration counts in one pass, without building filtered lists
+        exact_payload = 0
+        exact_headers = 0
+        for result in self.exact_match_blacklisted:
+            if result['category'] == 'headers':
+                exact_headers += 1
+            elif result['category'] in ['request', 'response']:
+                exact_payload += 1
         
         print(f"\n📋 FINAL CONFIGURATION (Exact Matches Only):")
         print(f"   payload.blacklist: {exact_payload} fields")
@@ -2023,13 +2322,12 @@ headers.blacklist=${{exactMatchHeaders.join(',')}}`;
     
     def analyze_data(self, data_file: str):
         """Analyze the extracted data with enhanced exact matching"""
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = read_json(data_file)
         
         # Analyze each field in the data
         for item in data.get('data', []):
             for field_path, values in item.items():
-                if field_path == 'curl':  # Skip curl commands
+                if field_path in SKIP_KEYS:  # Skip curl commands
                     continue
                 self.analyze_field(field_path, values)
         
@@ -2044,6 +2342,10 @@ headers.blacklist=${{exactMatchHeaders.join(',')}}`;
 def main():
     import sys
     
+    # Per-field match traces are logged at DEBUG; the CLI shows INFO and above on
+    # stdout, so load and per-field messages print exactly as they did before
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     if len(sys.argv) < 2:
         print("Usage: python enhanced_blacklist_generator.py <postman_extraction_results.json> [enhanced_patterns_config.json]")
         print("Example: python enhanced_blacklist_generator.py data.json enhanced_patterns_config.json")
@@ -4,11 +4,15 @@ Merge Developer Overrides Script
 Merges developer_overrides.json into patterns_config.json
 """
 
+import io
 import json
+import shutil
 import sys
 import os
 from datetime import datetime
 
+from blacklist_generator import read_json, write_json
+
 def merge_overrides(overrides_file: str, patterns_file: str):
     """Merge developer overrides into patterns configuration"""
     
@@ -23,23 +27,20 @@ def merge_overrides(overrides_file: str, patterns_file: str):
     
     try:
         # Load override file
-        with open(overrides_file, 'r') as f:
-            overrides = json.load(f)
+        overrides = read_json(overrides_file)
         
         print(f"📄 Loaded overrides from {overrides_file}")
         print(f"   • Manual blacklist: {len(overrides.get('manual_blacklist', []))} fields")
         print(f"   • Manual whitelist: {len(overrides.get('manual_whitelist', []))} fields")
         
         # Load patterns file
-        with open(patterns_file, 'r') as f:
-            patterns = json.load(f)
+        patterns = read_json(patterns_file)
         
         print(f"📄 Loaded patterns from {patterns_file}")
         
-        # Backup original patterns file
+        # Backup original patterns file (byte copy, the file on disk is still unmodified)
         backup_file = f"{patterns_file}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        with open(backup_file, 'w') as f:
-            json.dump(patterns, f, indent=2)
+        shutil.copyfile(patterns_file, backup_file)
         print(f"💾 Created backup: {backup_file}")
         
         # Get current overrides
@@ -47,48 +48,49 @@ def merge_overrides(overrides_file: str, patterns_file: str):
         current_blacklist = set(current_overrides.get('manual_blacklist', []))
         current_whitelist = set(current_overrides.get('manual_whitelist', []))
         
-        # Merge new overrides
-        new_blacklist = set(overrides.get('manual_blacklist', []))
-        new_whitelist = set(overrides.get('manual_whitelist', []))
-        
-        # Combine with existing (union)
-        combined_blacklist = current_blacklist.union(new_blacklist)
-        combined_whitelist = current_whitelist.union(new_whitelist)
+        # Merge new overrides into existing (in-place union)
+        current_blacklist.update(overrides.get('manual_blacklist', []))
+        current_whitelist.update(overrides.get('manual_whitelist', []))
         
         # Remove conflicts (whitelist takes precedence)
-        final_blacklist = combined_blacklist - combined_whitelist
-        final_whitelist = combined_whitelist
+        current_blacklist -= current_whitelist
+        
+        # Sorted so the version-controlled config keeps a stable order across merges
+        final_blacklist = sorted(current_blacklist)
+        final_whitelist = sorted(current_whitelist)
         
         # Update patterns config
         patterns['developer_overrides'] = {
-            'manual_blacklist': sorted(list(final_blacklist)),
-            'manual_whitelist': sorted(list(final_whitelist)),
+            'manual_blacklist': final_blacklist,
+            'manual_whitelist': final_whitelist,
             'last_updated': datetime.now().isoformat(),
             'merged_from': overrides_file
         }
         
         # Save updated patterns file
-        with open(patterns_file, 'w') as f:
-            json.dump(patterns, f, indent=2)
+        write_json(patterns_file, patterns)
         
-        print(f"✅ Successfully merged overrides into {patterns_file}")
-        print(f"📊 Final counts:")
-        print(f"   • Total manual blacklist: {len(final_blacklist)} fields")
-        print(f"   • Total manual whitelist: {len(final_whitelist)} fields")
+        # Build the merge report in memory and emit it with a single write
+        report = io.StringIO()
+        report.write(f"✅ Successfully merged overrides into {patterns_file}\n")
+        report.write(f"📊 Final counts:\n")
+        report.write(f"   • Total manual blacklist: {len(final_blacklist)} fields\n")
+        report.write(f"   • Total manual whitelist: {len(final_whitelist)} fields\n")
         
         if final_blacklist:
-            print(f"📋 Manual blacklist fields:")
-            for field in sorted(list(final_blacklist))[:10]:
-                print(f"   ✅ {field}")
+            report.write(f"📋 Manual blacklist fields:\n")
+            for field in final_blacklist[:10]:
+                report.write(f"   ✅ {field}\n")
             if len(final_blacklist) > 10:
-                print(f"   ... and {len(final_blacklist) - 10} more")
+                report.write(f"   ... and {len(final_blacklist) - 10} more\n")
         
         if final_whitelist:
-            print(f"📋 Manual whitelist fields:")
-            for field in sorted(list(final_whitelist))[:10]:
-                print(f"   ❌ {field}")
+            report.write(f"📋 Manual whitelist fields:\n")
+            for field in final_whitelist[:10]:
+                report.write(f"   ❌ {field}\n")
             if len(final_whitelist) > 10:
-                print(f"   ... and {len(final_whitelist) - 10} more")
+                report.write(f"   ... and {len(final_whitelist) - 10} more\n")
+        sys.stdout.write(report.getvalue())
         
         # Clean up override file
         os.remove(overrides_file)
@@ -2,14 +2,13 @@ from flask import Flask, render_template, request, jsonify, send_file
 import requests
 import base64
 import json
-from collections import defaultdict
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from urllib.parse import quote
 import os
 import re
 from datetime import datetime
-import pandas as pd
 from io import BytesIO
 
 app = Flask(__name__)
@@ -421,6 +420,8 @@ def preview_microservice():
 @app.route('/api/export/excel', methods=['POST'])
 def export_excel():
     """Export comparison results to Excel"""
+    import pandas as pd  # only needed for exports; keeps CLI imports of this module light
+    
     try:
         data = request.get_json()
         if not data or 'comparison_results' not in data:
@@ -438,12 +439,14 @@ def export_excel():
                 create_security_sheet(writer, security_issues)
             
             # Summary sheet
+            env_security_counts = Counter()
+            for category_data in security_issues.values():
+                for env_config, issues in category_data.items():
+                    env_security_counts[env_config] += len(issues)
+            
             summary_data = []
             for env_config, env_data in comparison_results.items():
-                env_security_count = 0
-                for issue_type in security_issues.values():
-                    if env_config in issue_type:
-                        env_security_count += len(issue_type[env_config])
+                env_security_count = env_security_counts[env_config]
                 
                 summary_data.append({
                     'Environment': env_config,
@@ -492,6 +495,8 @@ def export_excel():
 
 def create_security_sheet(writer, security_issues):
     """Create security analysis sheet"""
+    import pandas as pd
+    
     security_data = []
     
     for issue_category, category_data in security_issues.items():